@@ -14,10 +14,21 @@ ALGORITHM_METADATA = {
         'optimal': False,
         'category': 'greedy'
     },
+    'greedy-01': {
+        'id': 'greedy-01',
+        'name': 'Greedy 0/1 (Half-Approximation)',
+        'description': 'Returns the better of the greedy ratio prefix and the best single item, locating the break item by quickselect instead of sorting. Always a valid 0/1 loading.',
+        'timeComplexity': 'O(n) expected',
+        'spaceComplexity': 'O(n)',
+        'bestFor': 'Sub-millisecond fallback for million-item manifests',
+        'worstCase': 'Guaranteed only to reach half of the optimum',
+        'optimal': False,
+        'category': 'greedy'
+    },
     'dp-tabulation': {
         'id': 'dp-tabulation',
         'name': 'DP Tabulation',
-        'description': 'Bottom-up dynamic programming using a 2D table. Optimal for 0/1 knapsack.',
+        'description': 'Bottom-up dynamic programming using a 2D table. Optimal for 0/1 knapsack. Instances where value equals weight take a bitset subset-sum fast path.',
         'timeComplexity': 'O(n × W)',
         'spaceComplexity': 'O(n × W)',
         'bestFor': 'Large datasets with predictable patterns, guaranteed optimal solution',
@@ -25,6 +36,39 @@ ALGORITHM_METADATA = {
         'optimal': True,
         'category': 'dynamic-programming'
     },
+    'dp-hirschberg': {
+        'id': 'dp-hirschberg',
+        'name': 'DP Divide & Conquer (Hirschberg)',
+        'description': 'Splits items in half and uses forward/backward single-row DP to find the optimal capacity split, recursing on each half. Optimal with linear memory.',
+        'timeComplexity': 'O(n × W)',
+        'spaceComplexity': 'O(n + W)',
+        'bestFor': 'Very large item counts and capacities where a full DP table does not fit in memory',
+        'worstCase': 'Roughly twice the row updates of plain tabulation',
+        'optimal': True,
+        'category': 'dynamic-programming'
+    },
+    'dp-parallel': {
+        'id': 'dp-parallel',
+        'name': 'DP Parallel Wavefront',
+        'description': 'Splits each DP row across the capacity axis and updates the chunks on a process pool sharing the rows through shared memory. Optimal for 0/1 knapsack.',
+        'timeComplexity': 'O(n × W / cores)',
+        'spaceComplexity': 'O(W) + O(n × W) bits',
+        'bestFor': 'Single huge instances with capacities in the millions on many-core machines',
+        'worstCase': 'Per-row synchronization overhead dominates for small capacities',
+        'optimal': True,
+        'category': 'dynamic-programming'
+    },
+    'dp-out-of-core': {
+        'id': 'dp-out-of-core',
+        'name': 'DP Out-of-Core',
+        'description': 'Keeps a single DP row in memory and streams the packed decision table to a memory-mapped scratch file, then backtracks from disk. Optimal for 0/1 knapsack.',
+        'timeComplexity': 'O(n × W)',
+        'spaceComplexity': 'O(W) memory + n × W bits on disk',
+        'bestFor': 'Instances whose DP table is larger than RAM but fits the scratch disk budget',
+        'worstCase': 'Bounded by disk throughput and the configured disk budget',
+        'optimal': True,
+        'category': 'dynamic-programming'
+    },
     'memoization': {
         'id': 'memoization',
         'name': 'Memoization (Top-Down DP)',
@@ -57,5 +101,49 @@ ALGORITHM_METADATA = {
         'worstCase': 'Degrades to exhaustive search in worst case',
         'optimal': True,
         'category': 'backtracking'
+    },
+    'meet-in-middle': {
+        'id': 'meet-in-middle',
+        'name': 'Meet in the Middle',
+        'description': 'Enumerates non-dominated subset sums of each half of the items and merges them with a two-pointer sweep. Running time does not depend on capacity.',
+        'timeComplexity': 'O(2^(n/2))',
+        'spaceComplexity': 'O(2^(n/2))',
+        'bestFor': 'Huge weights and capacities with moderate item counts (n up to about 45)',
+        'worstCase': 'State count doubles with every two items added',
+        'optimal': True,
+        'category': 'backtracking'
+    },
+    'fptas': {
+        'id': 'fptas',
+        'name': 'FPTAS (Approximation)',
+        'description': 'Scales item values by epsilon and runs a profit-indexed DP. Returns a feasible 0/1 loading worth at least (1 - epsilon) of the optimum.',
+        'timeComplexity': 'O(n² / ε)',
+        'spaceComplexity': 'O(n² / ε) bits',
+        'bestFor': 'Large instances where a guaranteed near-optimal answer is worth trading for latency',
+        'worstCase': 'Running time grows as epsilon shrinks',
+        'optimal': False,
+        'category': 'approximation'
+    },
+    'local-search': {
+        'id': 'local-search',
+        'name': 'Local Search',
+        'description': 'Starts from the 0/1 greedy solution and improves it with add and swap moves until a local optimum or the time budget is reached.',
+        'timeComplexity': 'O(n log n) per improvement round',
+        'spaceComplexity': 'O(n)',
+        'bestFor': 'High-quality answers within a bounded time for very large item counts',
+        'worstCase': 'May stop at a local optimum below the true optimum',
+        'optimal': False,
+        'category': 'heuristic'
+    },
+    'auto': {
+        'id': 'auto',
+        'name': 'Auto (Fastest Exact)',
+        'description': 'Races DP tabulation, branch & bound and memoization in parallel processes and returns the first optimal answer.',
+        'timeComplexity': 'Fastest of the raced engines',
+        'spaceComplexity': 'Sum of the raced engines',
+        'bestFor': 'Instances of unknown hardness where no single exact algorithm is reliably fastest',
+        'worstCase': 'Process start-up overhead dominates on tiny inputs',
+        'optimal': True,
+        'category': 'portfolio'
     }
 }
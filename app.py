@@ -1,18 +1,30 @@
 from flask import Flask, render_template, request, jsonify, Response
 from flask_cors import CORS
+import os
 import json
+from itertools import chain
 
 # Import algorithms
-from algorithms.greedy import solve_greedy
+from algorithms.greedy import solve_greedy, solve_greedy_01
 from algorithms.dp_tabulation import solve_dp_tabulation
+from algorithms.dp_hirschberg import solve_dp_hirschberg
+from algorithms.dp_parallel import solve_dp_parallel
+from algorithms.dp_out_of_core import solve_dp_out_of_core
 from algorithms.memoization import solve_memoization
 from algorithms.recursion import solve_recursion
 from algorithms.branch_bound import solve_branch_bound
+from algorithms.meet_in_middle import solve_meet_in_middle
+from algorithms.fptas import solve_fptas
+from algorithms.local_search import solve_local_search
+from algorithms.portfolio import solve_auto
 
 # Import services
-from services.validation import validate_items, validate_capacity, validate_algorithm
-from services.export_service import export_to_json, export_to_csv, export_comparison_to_csv
+from services.validation import validate_items, validate_capacity, validate_algorithm, validate_selected_format, validate_include_steps, validate_gzip, validate_epsilon, validate_time_budget
+from services.export_service import iter_json, iter_csv, iter_comparison_csv, iter_ndjson, gzip_stream
 from services.recommendation import recommend_algorithm
+from services.json_response import json_response
+from services.manifest_import import import_csv_manifest, import_parquet_manifest
+from services.preset_cache import PresetCache
 
 # Import constants
 from constants.presets import DATA_PRESETS
@@ -24,12 +36,44 @@ CORS(app)  # Enable CORS for all routes
 # Algorithm mapping
 ALGORITHMS = {
     'greedy': solve_greedy,
+    'greedy-01': solve_greedy_01,
     'dp-tabulation': solve_dp_tabulation,
+    'dp-hirschberg': solve_dp_hirschberg,
+    'dp-parallel': solve_dp_parallel,
+    'dp-out-of-core': solve_dp_out_of_core,
     'memoization': solve_memoization,
     'recursion': solve_recursion,
-    'branch-bound': solve_branch_bound
+    'branch-bound': solve_branch_bound,
+    'meet-in-middle': solve_meet_in_middle,
+    'fptas': solve_fptas,
+    'local-search': solve_local_search,
+    'auto': solve_auto
 }
 
+# Optional per-algorithm request parameters: (request field, keyword, validator, converter)
+ALGORITHM_OPTIONS = {
+    'fptas': [('epsilon', 'epsilon', validate_epsilon, float)],
+    'local-search': [('timeBudget', 'time_budget', validate_time_budget, float)]
+}
+
+
+# Preset results are served from memory; KNAPSACK_PRESET_WARMUP=eager precomputes them at startup
+PRESET_CACHE = PresetCache(DATA_PRESETS, ALGORITHMS)
+if os.environ.get('KNAPSACK_PRESET_WARMUP', 'lazy') == 'eager':
+    PRESET_CACHE.warm()
+
+
+def algorithm_options(algorithm, params):
+    """Collect the optional parameters of one algorithm present in the request"""
+    options = {}
+    for field, keyword, validate, convert in ALGORITHM_OPTIONS.get(algorithm, []):
+        if field in params:
+            valid, msg = validate(params[field])
+            if not valid:
+                return None, msg
+            options[keyword] = convert(params[field])
+    return options, None
+
 
 @app.route('/')
 def index():
@@ -37,79 +81,229 @@ def index():
     return render_template('index.html')
 
 
+def solve_payload(data):
+    """
+    Validate a /api/solve request body and run the selected algorithm.
+    Returns (payload, status) so any server front end can encode it
+    """
+    
+    # Extract parameters
+    items = data.get('items', [])
+    capacity = data.get('capacity', 50)
+    algorithm = data.get('algorithm', 'greedy')
+    include_steps = data.get('includeSteps', True)
+    selected_format = data.get('selectedFormat', 'items')
+    
+    # Validate inputs
+    valid_items, items_msg = validate_items(items)
+    if not valid_items:
+        return {'error': items_msg}, 400
+    
+    valid_capacity, capacity_msg = validate_capacity(capacity)
+    if not valid_capacity:
+        return {'error': capacity_msg}, 400
+    
+    valid_algo, algo_msg = validate_algorithm(algorithm)
+    if not valid_algo:
+        return {'error': algo_msg}, 400
+    
+    valid_format, format_msg = validate_selected_format(selected_format)
+    if not valid_format:
+        return {'error': format_msg}, 400
+    
+    valid_steps, steps_msg = validate_include_steps(include_steps)
+    if not valid_steps:
+        return {'error': steps_msg}, 400
+    
+    options, options_msg = algorithm_options(algorithm, data)
+    if options_msg:
+        return {'error': options_msg}, 400
+    
+    # Default-shaped requests for an unmodified preset come from the cache
+    result = None
+    if include_steps and selected_format == 'items' and not options:
+        result = PRESET_CACHE.get(algorithm, items, capacity)
+    
+    # Solve using selected algorithm
+    if result is None:
+        result = ALGORITHMS[algorithm](
+            items,
+            capacity,
+            include_steps=include_steps,
+            item_indices=selected_format == 'indices',
+            **options
+        )
+    
+    return result, 200
+
+
 @app.route('/api/solve', methods=['POST'])
 def solve():
     """
     Solve knapsack problem with selected algorithm
-    Request body: { items: [], capacity: number, algorithm: string }
+    Request body: { items: [], capacity: number, algorithm: string,
+                    includeSteps: boolean, selectedFormat: 'items' | 'indices',
+                    epsilon: number (fptas only), timeBudget: ms (local-search only) }
     """
     try:
-        data = request.json
-        
-        # Extract parameters
-        items = data.get('items', [])
-        capacity = data.get('capacity', 50)
-        algorithm = data.get('algorithm', 'greedy')
-        
-        # Validate inputs
-        valid_items, items_msg = validate_items(items)
-        if not valid_items:
-            return jsonify({'error': items_msg}), 400
-        
-        valid_capacity, capacity_msg = validate_capacity(capacity)
-        if not valid_capacity:
-            return jsonify({'error': capacity_msg}), 400
-        
-        valid_algo, algo_msg = validate_algorithm(algorithm)
-        if not valid_algo:
-            return jsonify({'error': algo_msg}), 400
-        
-        # Solve using selected algorithm
-        result = ALGORITHMS[algorithm](items, capacity)
-        
-        return jsonify(result)
+        payload, status = solve_payload(request.json)
+        return json_response(payload, status)
+    
+    except Exception as e:
+        return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+
+def upload_payload(form, manifest):
+    """
+    Validate a /api/solve/upload form, import its manifest file and run
+    the selected algorithm. Returns (payload, status) so any server front
+    end can encode it
+    """
+    if manifest is None:
+        return {'error': "Missing 'manifest' file upload"}, 400
+    
+    # Extract parameters
+    capacity = form.get('capacity', 50)
+    algorithm = form.get('algorithm', 'greedy')
+    include_steps = {'true': True, 'false': False}.get(form.get('includeSteps', 'true').lower())
+    selected_format = form.get('selectedFormat', 'items')
+    
+    # Validate inputs
+    valid_capacity, capacity_msg = validate_capacity(capacity)
+    if not valid_capacity:
+        return {'error': capacity_msg}, 400
+    
+    valid_algo, algo_msg = validate_algorithm(algorithm)
+    if not valid_algo:
+        return {'error': algo_msg}, 400
+    
+    valid_format, format_msg = validate_selected_format(selected_format)
+    if not valid_format:
+        return {'error': format_msg}, 400
+    
+    valid_steps, steps_msg = validate_include_steps(include_steps)
+    if not valid_steps:
+        return {'error': steps_msg}, 400
+    
+    options, options_msg = algorithm_options(algorithm, form)
+    if options_msg:
+        return {'error': options_msg}, 400
+    
+    capacity = float(capacity)
+    if capacity.is_integer():
+        capacity = int(capacity)
+    
+    # Parse and validate the manifest chunk by chunk into solver columns
+    if (manifest.filename or '').lower().endswith('.parquet'):
+        table, errors = import_parquet_manifest(manifest.stream)
+    else:
+        table, errors = import_csv_manifest(manifest.stream)
+    
+    if errors:
+        return {'error': 'Invalid manifest', 'errors': errors}, 400
+    
+    result = ALGORITHMS[algorithm](
+        table,
+        capacity,
+        include_steps=include_steps,
+        item_indices=selected_format == 'indices',
+        **options
+    )
+    
+    return result, 200
+
+
+@app.route('/api/solve/upload', methods=['POST'])
+def solve_upload():
+    """
+    Solve a bulk manifest uploaded as a CSV (or Parquet) file
+    Form fields: { manifest: file, capacity: number, algorithm: string,
+                   includeSteps: 'true' | 'false', selectedFormat: 'items' | 'indices',
+                   epsilon: number (fptas only), timeBudget: ms (local-search only) }
+    """
+    try:
+        payload, status = upload_payload(request.form, request.files.get('manifest'))
+        return json_response(payload, status)
     
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
 
 
+def compare_payload(data):
+    """
+    Validate a /api/compare request body and run every algorithm.
+    Returns (payload, status) so any server front end can encode it
+    """
+    items = data.get('items', [])
+    capacity = data.get('capacity', 50)
+    include_steps = data.get('includeSteps', True)
+    selected_format = data.get('selectedFormat', 'items')
+    
+    # Validate inputs
+    valid_items, items_msg = validate_items(items)
+    if not valid_items:
+        return {'error': items_msg}, 400
+    
+    valid_capacity, capacity_msg = validate_capacity(capacity)
+    if not valid_capacity:
+        return {'error': capacity_msg}, 400
+    
+    valid_format, format_msg = validate_selected_format(selected_format)
+    if not valid_format:
+        return {'error': format_msg}, 400
+    
+    valid_steps, steps_msg = validate_include_steps(include_steps)
+    if not valid_steps:
+        return {'error': steps_msg}, 400
+    
+    algo_options = {}
+    for algo_name in ALGORITHMS:
+        options, options_msg = algorithm_options(algo_name, data)
+        if options_msg:
+            return {'error': options_msg}, 400
+        algo_options[algo_name] = options
+    
+    # Run all algorithms
+    results = []
+    for algo_name, algo_func in ALGORITHMS.items():
+        try:
+            result = None
+            if include_steps and selected_format == 'items' and not algo_options[algo_name]:
+                result = PRESET_CACHE.get(algo_name, items, capacity)
+    
+            if result is None:
+                result = algo_func(
+                    items,
+                    capacity,
+                    include_steps=include_steps,
+                    item_indices=selected_format == 'indices',
+                    **algo_options[algo_name]
+                )
+            results.append(result)
+        except Exception as e:
+            results.append({
+                'algorithm': algo_name,
+                'error': str(e),
+                'maxProfit': 0,
+                'totalWeight': 0,
+                'executionTime': 0,
+                'selectedItems': []
+            })
+    
+    return {'results': results}, 200
+
+
 @app.route('/api/compare', methods=['POST'])
 def compare():
     """
     Compare all algorithms on same dataset
-    Request body: { items: [], capacity: number }
+    Request body: { items: [], capacity: number,
+                    includeSteps: boolean, selectedFormat: 'items' | 'indices',
+                    epsilon: number (fptas only), timeBudget: ms (local-search only) }
     """
     try:
-        data = request.json
-        items = data.get('items', [])
-        capacity = data.get('capacity', 50)
-        
-        # Validate inputs
-        valid_items, items_msg = validate_items(items)
-        if not valid_items:
-            return jsonify({'error': items_msg}), 400
-        
-        valid_capacity, capacity_msg = validate_capacity(capacity)
-        if not valid_capacity:
-            return jsonify({'error': capacity_msg}), 400
-        
-        # Run all algorithms
-        results = []
-        for algo_name, algo_func in ALGORITHMS.items():
-            try:
-                result = algo_func(items, capacity)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    'algorithm': algo_name,
-                    'error': str(e),
-                    'maxProfit': 0,
-                    'totalWeight': 0,
-                    'executionTime': 0,
-                    'selectedItems': []
-                })
-        
-        return jsonify({'results': results})
+        payload, status = compare_payload(request.json)
+        return json_response(payload, status)
     
     except Exception as e:
         return jsonify({'error': f'Server error: {str(e)}'}), 500
@@ -150,31 +344,61 @@ def get_presets():
     return jsonify({'presets': DATA_PRESETS})
 
 
+@app.route('/api/presets/cache', methods=['GET'])
+def get_preset_cache_stats():
+    """
+    Get preset cache hit/miss counts and warm-up cost for this process
+    (asgi.py answers this route itself, summed over its solver workers)
+    """
+    return jsonify(PRESET_CACHE.stats)
+
+
 @app.route('/api/algorithms', methods=['GET'])
 def get_algorithms():
     """Get all algorithm metadata"""
     return jsonify({'algorithms': ALGORITHM_METADATA})
 
 
+def stream_export(chunks, mimetype, filename, compress=False):
+    """
+    Stream exporter chunks as a download, optionally gzip-compressed on the fly.
+    The first chunk is pulled eagerly: the exporters validate every result
+    before yielding it, so malformed input still fails with a 500.
+    """
+    chunks = iter(chunks)
+    first = next(chunks, '')
+    stream = chain([first], chunks)
+    headers = {'Content-Disposition': f'attachment; filename={filename}'}
+    
+    if compress:
+        stream = gzip_stream(stream)
+        headers['Content-Encoding'] = 'gzip'
+    
+    return Response(stream, mimetype=mimetype, headers=headers)
+
+
 @app.route('/api/export/json', methods=['POST'])
 def export_json():
     """
     Export result as JSON
-    Request body: { result: {}, includeSteps: boolean }
+    Request body: { result: {}, includeSteps: boolean, gzip: boolean }
     """
     try:
         data = request.json
+        compress = data.get('gzip', False)
+        
+        valid_gzip, gzip_msg = validate_gzip(compress)
+        if not valid_gzip:
+            return jsonify({'error': gzip_msg}), 400
+        
         result = data.get('result', {})
         include_steps = data.get('includeSteps', False)
         
-        json_output = export_to_json(result, include_steps)
-        
-        return Response(
-            json_output,
-            mimetype='application/json',
-            headers={
-                'Content-Disposition': 'attachment; filename=knapsack-result.json'
-            }
+        return stream_export(
+            iter_json(result, include_steps),
+            'application/json',
+            'knapsack-result.json',
+            compress=compress
         )
     
     except Exception as e:
@@ -185,20 +409,23 @@ def export_json():
 def export_csv():
     """
     Export result as CSV
-    Request body: { result: {} }
+    Request body: { result: {}, gzip: boolean }
     """
     try:
         data = request.json
-        result = data.get('result', {})
+        compress = data.get('gzip', False)
+        
+        valid_gzip, gzip_msg = validate_gzip(compress)
+        if not valid_gzip:
+            return jsonify({'error': gzip_msg}), 400
         
-        csv_output = export_to_csv(result)
+        result = data.get('result', {})
         
-        return Response(
-            csv_output,
-            mimetype='text/csv',
-            headers={
-                'Content-Disposition': 'attachment; filename=knapsack-result.csv'
-            }
+        return stream_export(
+            iter_csv(result),
+            'text/csv',
+            'knapsack-result.csv',
+            compress=compress
         )
     
     except Exception as e:
@@ -209,20 +436,50 @@ def export_csv():
 def export_comparison_csv():
     """
     Export comparison results as CSV
-    Request body: { results: [] }
+    Request body: { results: [], gzip: boolean }
     """
     try:
         data = request.json
+        compress = data.get('gzip', False)
+        
+        valid_gzip, gzip_msg = validate_gzip(compress)
+        if not valid_gzip:
+            return jsonify({'error': gzip_msg}), 400
+        
         results = data.get('results', [])
         
-        csv_output = export_comparison_to_csv(results)
+        return stream_export(
+            iter_comparison_csv(results),
+            'text/csv',
+            'algorithm-comparison.csv',
+            compress=compress
+        )
+    
+    except Exception as e:
+        return jsonify({'error': f'Export error: {str(e)}'}), 500
+
+
+@app.route('/api/export/ndjson', methods=['POST'])
+def export_ndjson():
+    """
+    Export one result or a batch of results as NDJSON
+    Request body: { result: {} } or { results: [] }, gzip: boolean
+    """
+    try:
+        data = request.json
+        compress = data.get('gzip', False)
+        
+        valid_gzip, gzip_msg = validate_gzip(compress)
+        if not valid_gzip:
+            return jsonify({'error': gzip_msg}), 400
+        
+        results = data['results'] if 'results' in data else [data.get('result', {})]
         
-        return Response(
-            csv_output,
-            mimetype='text/csv',
-            headers={
-                'Content-Disposition': 'attachment; filename=algorithm-comparison.csv'
-            }
+        return stream_export(
+            iter_ndjson(results),
+            'application/x-ndjson',
+            'knapsack-results.ndjson',
+            compress=compress
         )
     
     except Exception as e:
@@ -246,5 +503,7 @@ def internal_error(e):
 if __name__ == '__main__':
     print("🚀 Cargo Loading Optimizer - Flask Backend")
     print("📊 Starting server on http://localhost:5000")
+    if PRESET_CACHE.stats['warmupTime']:
+        print(f"🔥 Preset cache warmed: {PRESET_CACHE.stats['entries']} results in {PRESET_CACHE.stats['warmupTime'] / 1000:.1f} ms")
     print("=" * 50)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,235 @@
+"""
+ASGI entry point - production serving mode
+
+    pip install -r requirements-asgi.txt
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+Solver routes (/api/solve, /api/compare, /api/solve/upload) run on a
+bounded process pool so CPU-bound algorithms never block the event loop;
+the request body is decoded in the worker too, so neither a large JSON
+body nor a multipart manifest upload is parsed on the loop. Requests over
+the queue limit get 429 with Retry-After instead of piling up. If a worker
+dies (e.g. killed for memory) the pool is replaced and the requests it
+broke get 503 with Retry-After. The static routes (/api/presets,
+/api/algorithms) are answered straight from the loop with pre-encoded
+bodies. Every other route is served by the Flask app through the WSGI
+adapter, so the JSON contracts are identical.
+
+Each solver process has its own preset cache, so /api/presets/cache is
+also answered here: hits and misses are summed over this process and
+every worker that has served a solve, and entries is the largest cache.
+
+Environment:
+    KNAPSACK_SOLVER_WORKERS   solver processes (default: CPU count)
+    KNAPSACK_MAX_PENDING      solver requests queued or running before 429
+                              (default: 4 per worker)
+    KNAPSACK_RETRY_AFTER      Retry-After seconds sent with 429/503 (default: 1)
+"""
+
+import io
+import os
+import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:  # asgiref/uvicorn are optional, only needed for this serving mode
+    raise ImportError('The ASGI serving mode needs asgiref and uvicorn: pip install -r requirements-asgi.txt') from None
+
+from werkzeug.formparser import parse_form_data
+
+from app import app as flask_app, solve_payload, compare_payload, upload_payload, PRESET_CACHE
+
+from services.json_response import encode_json
+
+from constants.presets import DATA_PRESETS
+from constants.algorithm_metadata import ALGORITHM_METADATA
+
+
+SOLVER_WORKERS = int(os.environ.get('KNAPSACK_SOLVER_WORKERS') or os.cpu_count() or 1)
+MAX_PENDING = int(os.environ.get('KNAPSACK_MAX_PENDING') or SOLVER_WORKERS * 4)
+RETRY_AFTER = int(os.environ.get('KNAPSACK_RETRY_AFTER', 1))
+
+def _solve(content_type, body):
+    return solve_payload(json.loads(body))
+
+
+def _compare(content_type, body):
+    return compare_payload(json.loads(body))
+
+
+def _solve_upload(content_type, body):
+    """Parse the multipart form with Flask's own parser, then solve the manifest"""
+    _, form, files = parse_form_data({
+        'REQUEST_METHOD': 'POST',
+        'CONTENT_TYPE': content_type,
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.input': io.BytesIO(body)
+    })
+    return upload_payload(form, files.get('manifest'))
+
+
+# Routes whose work (body decoding included) is offloaded to the solver pool
+SOLVER_ROUTES = {
+    '/api/solve': _solve,
+    '/api/compare': _compare,
+    '/api/solve/upload': _solve_upload
+}
+
+# Routes whose response never changes, encoded once at import
+STATIC_ROUTES = {
+    '/api/presets': encode_json({'presets': DATA_PRESETS}),
+    '/api/algorithms': encode_json({'algorithms': ALGORITHM_METADATA})
+}
+
+
+def _reset_worker_stats():
+    """Pool initializer: count cache hits/misses from zero (fork copies the parent's)"""
+    PRESET_CACHE.stats['hits'] = 0
+    PRESET_CACHE.stats['misses'] = 0
+
+
+def _run_in_worker(handler, content_type, body):
+    """Run a solver route in a pool worker, returning its preset cache counters too"""
+    payload, status = handler(content_type, body)
+    stats = PRESET_CACHE.stats
+    counters = {'hits': stats['hits'], 'misses': stats['misses'], 'entries': stats['entries']}
+    return payload, status, os.getpid(), counters
+
+
+class SolverServer:
+    """ASGI app: solver pool + static fast path + Flask fallback"""
+
+    def __init__(self, wsgi_app, workers=SOLVER_WORKERS, max_pending=MAX_PENDING):
+        self.fallback = WsgiToAsgi(wsgi_app)
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.pool = None
+        self.worker_cache = {}
+        self.stats = {'offloaded': 0, 'rejected': 0, 'static': 0}
+
+    def start(self):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_reset_worker_stats)
+
+    def stop(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+            self.worker_cache = {}
+
+    def discard(self, pool):
+        """Drop a broken pool; the next solver request starts a fresh one"""
+        if self.pool is pool:
+            self.pool = None
+            self.worker_cache = {}
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self.lifespan(receive, send)
+
+        if scope['type'] == 'http':
+            path = scope['path']
+            method = scope['method']
+
+            if method == 'GET' and path in STATIC_ROUTES:
+                self.stats['static'] += 1
+                return await self.respond(send, 200, STATIC_ROUTES[path])
+
+            if method == 'GET' and path == '/api/presets/cache':
+                return await self.respond(send, 200, encode_json(self.cache_stats()))
+
+            if method == 'POST' and path in SOLVER_ROUTES:
+                return await self.offload(SOLVER_ROUTES[path], scope, receive, send)
+
+        return await self.fallback(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def offload(self, handler, scope, receive, send):
+        """Run a solver route in the pool, or shed load with 429"""
+        retry_after = [(b'retry-after', str(RETRY_AFTER).encode())]
+        if self.pending >= self.max_pending:
+            self.stats['rejected'] += 1
+            return await self.respond(
+                send, 429,
+                encode_json({'error': 'Solver queue is full, retry later'}),
+                retry_after
+            )
+
+        headers = ()
+        self.pending += 1
+        try:
+            body = await read_body(receive)
+            try:
+                self.start()
+                pool = self.pool
+                content_type = dict(scope['headers']).get(b'content-type', b'').decode('latin-1')
+                loop = asyncio.get_running_loop()
+                payload, status, pid, counters = await loop.run_in_executor(
+                    pool, _run_in_worker, handler, content_type, body
+                )
+                self.worker_cache[pid] = counters
+                self.stats['offloaded'] += 1
+            except BrokenProcessPool:
+                # A worker died mid-solve; every queued future fails with it
+                self.discard(pool)
+                payload, status = {'error': 'Solver pool restarted, retry later'}, 503
+                headers = retry_after
+            except Exception as e:
+                payload, status = {'error': f'Server error: {str(e)}'}, 500
+        finally:
+            self.pending -= 1
+
+        return await self.respond(send, status, encode_json(payload), headers)
+
+    def cache_stats(self):
+        """Preset cache stats of this process combined with every solver worker's"""
+        stats = {**PRESET_CACHE.stats, 'processes': 1 + len(self.worker_cache)}
+        for counters in self.worker_cache.values():
+            stats['hits'] += counters['hits']
+            stats['misses'] += counters['misses']
+            stats['entries'] = max(stats['entries'], counters['entries'])
+        return stats
+
+    async def respond(self, send, status, body, headers=()):
+        if isinstance(body, str):
+            body = body.encode()  # stdlib fallback of encode_json returns str
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'access-control-allow-origin', b'*'),
+                *headers
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+async def read_body(receive):
+    """Collect the full request body from ASGI receive events"""
+    chunks = []
+    more = True
+    while more:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        more = message.get('more_body', False)
+    return b''.join(chunks)
+
+
+app = SolverServer(flask_app)
@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark - CLI entry point vs the Flask app
+
+    python bench_cold_start.py [--runs 7] [--algorithms dp-tabulation greedy-01]
+
+Every sample is a fresh interpreter, as in a batch job or a serverless
+invocation. Reported per scenario: median wall time of the whole process,
+median in-process import time and the number of modules loaded.
+
+    interpreter     python -c pass (the floor)
+    flask-import    import app (Flask, every engine and service)
+    cli-import      import cli (validation only)
+    cli-solve:X     python -m cli solve <manifest> --algorithm X, end to end
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+import subprocess
+import time
+from statistics import median
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Prints import time (microseconds) and the module count after the import
+IMPORT_PROBE = (
+    'import sys, time\n'
+    'start = time.perf_counter()\n'
+    '{statement}\n'
+    'print((time.perf_counter() - start) * 1_000_000, len(sys.modules))\n'
+)
+
+
+def write_manifest(path, n, seed):
+    """Random JSON manifest with a capacity of about half the total weight"""
+    rng = random.Random(seed)
+    items = [
+        {'item': f'Crate {i}', 'weight': rng.randint(1, 50), 'value': rng.randint(1, 200)}
+        for i in range(n)
+    ]
+    capacity = sum(item['weight'] for item in items) // 2
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'items': items, 'capacity': capacity}, f)
+
+
+def sample(command):
+    """Run one fresh interpreter; returns (wall ms, probe output)"""
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True)
+    return (time.perf_counter() - start) * 1000, completed.stdout
+
+
+def bench_import(statement, runs):
+    walls, imports, modules = [], [], 0
+    for _ in range(runs):
+        wall, output = sample([sys.executable, '-c', IMPORT_PROBE.format(statement=statement)])
+        import_us, modules = output.split()
+        walls.append(wall)
+        imports.append(float(import_us) / 1000)
+    return median(walls), median(imports), int(modules)
+
+
+def bench_command(args, runs):
+    walls = [sample([sys.executable, *args])[0] for _ in range(runs)]
+    return median(walls), None, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7, help='fresh interpreters per scenario')
+    parser.add_argument('--algorithms', nargs='+', default=['dp-tabulation', 'greedy-01'])
+    parser.add_argument('--items', type=int, default=50, help='items in the sample manifest')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        manifest = os.path.join(scratch, 'manifest.json')
+        write_manifest(manifest, args.items, args.seed)
+
+        scenarios = [
+            ('interpreter', bench_import('pass', args.runs)),
+            ('flask-import', bench_import('import app', args.runs)),
+            ('cli-import', bench_import('import cli', args.runs))
+        ]
+        for algorithm in args.algorithms:
+            scenarios.append((
+                f'cli-solve:{algorithm}',
+                bench_command(['-m', 'cli', 'solve', manifest, '--algorithm', algorithm], args.runs)
+            ))
+
+    print(f"{'scenario':<26} {'wall ms':>9} {'import ms':>10} {'modules':>8}")
+    for name, (wall, import_ms, modules) in scenarios:
+        import_col = f'{import_ms:.1f}' if import_ms is not None else '-'
+        modules_col = modules if modules is not None else '-'
+        print(f'{name:<26} {wall:>9.1f} {import_col:>10} {modules_col:>8}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,10 @@
 import time
 from queue import PriorityQueue
 
+from algorithms.item_table import ItemTable
 
-def solve_branch_bound(items, capacity):
+
+def solve_branch_bound(items, capacity, include_steps=True, item_indices=False):
     """
     Branch and Bound algorithm (0/1 Knapsack)
     Intelligent tree search with pruning using bounds
@@ -11,24 +13,15 @@ def solve_branch_bound(items, capacity):
     """
     start_time = time.perf_counter()  # ✅ CHANGED
     
-    n = len(items)
+    table = ItemTable(items, item_indices=item_indices)
+    n = len(table)
     capacity = int(capacity)
     
-    # Convert weights to integers and calculate ratios
-    int_items = []
-    for item in items:
-        int_item = {
-            **item,
-            'weight': int(item['weight'])
-        }
-        if int_item['weight'] > 0:
-            int_item['ratio'] = int_item['value'] / int_item['weight']
-        else:
-            int_item['ratio'] = 0
-        int_items.append(int_item)
-    
-    # Sort by value/weight ratio
-    sorted_items = sorted(int_items, key=lambda x: x['ratio'], reverse=True)
+    # Sort item indices by value/weight ratio
+    order = sorted(range(n), key=table.ratios.__getitem__, reverse=True)
+    sorted_weights = [table.weights[i] for i in order]
+    sorted_values = [table.values[i] for i in order]
+    sorted_ratios = [table.ratios[i] for i in order]
     
     class Node:
         def __init__(self, level, profit, weight, bound, items_taken):
@@ -51,14 +44,14 @@ def solve_branch_bound(items, capacity):
         total_weight = node.weight
         
         # Add items greedily to calculate bound
-        while j < n and total_weight + sorted_items[j]['weight'] <= capacity:
-            total_weight += sorted_items[j]['weight']
-            profit_bound += sorted_items[j]['value']
+        while j < n and total_weight + sorted_weights[j] <= capacity:
+            total_weight += sorted_weights[j]
+            profit_bound += sorted_values[j]
             j += 1
         
         # Add fractional part of next item
         if j < n:
-            profit_bound += (capacity - total_weight) * sorted_items[j]['ratio']
+            profit_bound += (capacity - total_weight) * sorted_ratios[j]
         
         return profit_bound
     
@@ -78,8 +71,8 @@ def solve_branch_bound(items, capacity):
             
             if level < n:
                 # Include item
-                new_weight = node.weight + sorted_items[level]['weight']
-                new_profit = node.profit + sorted_items[level]['value']
+                new_weight = node.weight + sorted_weights[level]
+                new_profit = node.profit + sorted_values[level]
                 new_items = node.items_taken + [level]
                 
                 if new_weight <= capacity and new_profit > max_profit:
@@ -100,22 +93,16 @@ def solve_branch_bound(items, capacity):
                     pq.put(new_node)
     
     # Reconstruct solution
-    selected_items = []
-    for idx in best_items:
-        selected_items.append({
-            **sorted_items[idx],
-            'selected': True,
-            'fraction': 1.0
-        })
+    selected = [order[idx] for idx in best_items]
     
     execution_time = (time.perf_counter() - start_time) * 1_000_000  # ✅ CHANGED to microseconds
     
-    total_weight = sum(item['weight'] for item in selected_items)
+    total_weight = table.total_weight(selected)
     
     return {
         'maxProfit': round(max_profit, 2),
         'totalWeight': round(total_weight, 2),
-        'selectedItems': selected_items,
+        **table.selection(selected, with_ratio=True),
         'executionTime': round(execution_time, 2),
         'algorithm': 'branch-bound',
         'steps': []
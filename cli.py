@@ -0,0 +1,162 @@
+"""
+Command-line solver - fast cold start for batch and serverless runs
+
+    python -m cli solve manifest.json --algorithm dp-tabulation
+    python -m cli solve manifest.csv --capacity 5000 --algorithm fptas --epsilon 0.05
+
+Unlike app.py this imports neither Flask nor every engine: only the module
+of the selected algorithm is loaded, and heavy optional backends (numpy and
+the numba kernels, pyarrow) load on first use. The result is the same JSON
+object /api/solve returns, written to stdout (or --output).
+
+Manifests are .json (a list of items, or an object with 'items' and an
+optional 'capacity', like a preset or an /api/solve body), .csv or
+.parquet (columns item, weight, value).
+"""
+
+import sys
+import json
+import argparse
+from importlib import import_module
+
+from services.validation import validate_items, validate_capacity, validate_algorithm, validate_epsilon, validate_time_budget
+
+
+# Algorithm id -> (module, solver function), imported only when selected
+ENGINES = {
+    'greedy': ('algorithms.greedy', 'solve_greedy'),
+    'greedy-01': ('algorithms.greedy', 'solve_greedy_01'),
+    'dp-tabulation': ('algorithms.dp_tabulation', 'solve_dp_tabulation'),
+    'dp-hirschberg': ('algorithms.dp_hirschberg', 'solve_dp_hirschberg'),
+    'dp-parallel': ('algorithms.dp_parallel', 'solve_dp_parallel'),
+    'dp-out-of-core': ('algorithms.dp_out_of_core', 'solve_dp_out_of_core'),
+    'memoization': ('algorithms.memoization', 'solve_memoization'),
+    'recursion': ('algorithms.recursion', 'solve_recursion'),
+    'branch-bound': ('algorithms.branch_bound', 'solve_branch_bound'),
+    'meet-in-middle': ('algorithms.meet_in_middle', 'solve_meet_in_middle'),
+    'fptas': ('algorithms.fptas', 'solve_fptas'),
+    'local-search': ('algorithms.local_search', 'solve_local_search'),
+    'auto': ('algorithms.portfolio', 'solve_auto')
+}
+
+
+def load_engine(algorithm):
+    """Import the selected solver's module and return its solve function"""
+    module_name, function_name = ENGINES[algorithm]
+    return getattr(import_module(module_name), function_name)
+
+
+def load_manifest(path):
+    """Returns (items or ItemTable, capacity from the manifest or None, error message)"""
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8-sig') as f:
+            data = json.load(f)
+
+        capacity = None
+        if isinstance(data, dict):
+            capacity = data.get('capacity')
+            data = data.get('items')
+
+        valid_items, items_msg = validate_items(data)
+        if not valid_items:
+            return None, None, items_msg
+        return data, capacity, None
+
+    from services.manifest_import import import_manifest_file
+
+    table, errors = import_manifest_file(path)
+    if errors:
+        messages = [f"row {error['row']}: {error['message']}" if error['row'] else error['message'] for error in errors]
+        return None, None, 'Invalid manifest - ' + '; '.join(messages)
+    return table, None, None
+
+
+def solve(args):
+    """Validate the arguments, solve the manifest and return (payload, exit code)"""
+    valid_algo, algo_msg = validate_algorithm(args.algorithm)
+    if not valid_algo:
+        return {'error': algo_msg}, 2
+
+    options = {}
+    if args.epsilon is not None:
+        if args.algorithm != 'fptas':
+            return {'error': '--epsilon only applies to fptas'}, 2
+        valid_epsilon, epsilon_msg = validate_epsilon(args.epsilon)
+        if not valid_epsilon:
+            return {'error': epsilon_msg}, 2
+        options['epsilon'] = args.epsilon
+    if args.time_budget is not None:
+        if args.algorithm != 'local-search':
+            return {'error': '--time-budget only applies to local-search'}, 2
+        valid_budget, budget_msg = validate_time_budget(args.time_budget)
+        if not valid_budget:
+            return {'error': budget_msg}, 2
+        options['time_budget'] = args.time_budget
+
+    items, capacity, manifest_msg = load_manifest(args.manifest)
+    if manifest_msg:
+        return {'error': manifest_msg}, 1
+
+    if args.capacity is not None:
+        capacity = args.capacity
+    if capacity is None:
+        return {'error': "Capacity is required: pass --capacity or set 'capacity' in a JSON manifest"}, 2
+
+    valid_capacity, capacity_msg = validate_capacity(capacity)
+    if not valid_capacity:
+        return {'error': capacity_msg}, 2
+
+    capacity = float(capacity)
+    if capacity.is_integer():
+        capacity = int(capacity)
+
+    result = load_engine(args.algorithm)(
+        items,
+        capacity,
+        include_steps=args.steps,
+        item_indices=args.indices,
+        **options
+    )
+    return result, 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m cli', description='Cargo Loading Optimizer - command-line solver')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    solve_parser = commands.add_parser('solve', help='solve a manifest file and print the result as JSON')
+    solve_parser.add_argument('manifest', help='.json, .csv or .parquet manifest')
+    solve_parser.add_argument('--algorithm', '-a', default='dp-tabulation', choices=list(ENGINES))
+    solve_parser.add_argument('--capacity', '-c', type=float, help="hold capacity (overrides a JSON manifest's 'capacity')")
+    solve_parser.add_argument('--epsilon', type=float, help='approximation error (fptas only)')
+    solve_parser.add_argument('--time-budget', type=float, help='improvement time budget in ms (local-search only)')
+    solve_parser.add_argument('--steps', action='store_true', help='include step descriptions')
+    solve_parser.add_argument('--indices', action='store_true', help='return selectedIndices instead of item objects')
+    solve_parser.add_argument('--output', '-o', help='write the JSON result here instead of stdout')
+    solve_parser.add_argument('--indent', type=int, help='pretty-print with this indent')
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    try:
+        payload, code = solve(args)
+    except (OSError, ValueError) as e:
+        payload, code = {'error': str(e)}, 1
+
+    text = json.dumps(payload, indent=args.indent, ensure_ascii=False)
+    if code:
+        print(text, file=sys.stderr)
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
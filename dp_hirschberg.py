@@ -0,0 +1,111 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from algorithms.item_table import ItemTable
+
+
+def _best_row(weights, values, lo, hi, capacity):
+    """Single-row DP: row[c] = best value from items lo..hi-1 within capacity c"""
+    row = [0] * (capacity + 1)
+    for i in range(lo, hi):
+        weight = weights[i]
+        value = values[i]
+        for c in range(capacity, weight - 1, -1):
+            candidate = row[c - weight] + value
+            if candidate > row[c]:
+                row[c] = candidate
+    return row
+
+
+def _best_split(left, right, capacity):
+    """Capacity given to the left half that maximizes left + right"""
+    best_c = 0
+    best_value = left[0] + right[capacity]
+    for c in range(1, capacity + 1):
+        value = left[c] + right[capacity - c]
+        if value > best_value:
+            best_c = c
+            best_value = value
+    return best_c
+
+
+def _solve_range(weights, values, lo, hi, capacity, selected):
+    """Append the indices of an optimal subset of items lo..hi-1 to selected"""
+    if lo >= hi:
+        return
+
+    if hi - lo == 1:
+        if weights[lo] <= capacity and values[lo] > 0:
+            selected.append(lo)
+        return
+
+    # Everything fits - no DP needed for this range
+    if sum(weights[lo:hi]) <= capacity:
+        selected.extend(i for i in range(lo, hi) if values[i] > 0)
+        return
+
+    mid = (lo + hi) // 2
+    left = _best_row(weights, values, lo, mid, capacity)
+    right = _best_row(weights, values, mid, hi, capacity)
+    split = _best_split(left, right, capacity)
+    del left, right  # Only O(W) is ever live per recursion level
+
+    _solve_range(weights, values, lo, mid, split, selected)
+    _solve_range(weights, values, mid, hi, capacity - split, selected)
+
+
+def _solve_subrange(weights, values, lo, hi, capacity):
+    """Process-pool entry point: solve one half and return its indices"""
+    selected = []
+    _solve_range(weights, values, lo, hi, capacity, selected)
+    return selected
+
+
+def solve_dp_hirschberg(items, capacity, include_steps=True, item_indices=False, parallel=False):
+    """
+    Dynamic Programming - Hirschberg Divide & Conquer (0/1 Knapsack)
+    Splits the items in half, finds the optimal capacity split from a
+    forward and a backward single-row DP, and recurses on both halves.
+    With parallel=True the two halves are solved on separate cores.
+    Time Complexity: O(n × W)
+    Space Complexity: O(n + W)
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
+    capacity = int(capacity)
+
+    selected = []
+    if parallel and n > 1 and sum(weights) > capacity:
+        mid = n // 2
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            left = pool.submit(_best_row, weights, values, 0, mid, capacity)
+            right = pool.submit(_best_row, weights, values, mid, n, capacity)
+            split = _best_split(left.result(), right.result(), capacity)
+            del left, right
+
+            left = pool.submit(_solve_subrange, weights, values, 0, mid, split)
+            right = pool.submit(_solve_subrange, weights, values, mid, n, capacity - split)
+            selected = left.result() + right.result()
+    else:
+        _solve_range(weights, values, 0, n, capacity, selected)
+
+    max_profit = sum(values[i] for i in selected)
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'dp-hirschberg',
+        'steps': steps
+    }
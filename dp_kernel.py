@@ -0,0 +1,109 @@
+"""
+DP table kernels for the tabulation engine
+
+The row update and backtrack run on a Numba-compiled kernel when numba and
+numpy are installed and the table is large enough to repay loading them
+(see select_backend), and on the pure-Python loops otherwise. Whether numba
+is available is decided at import time and exposed as DP_BACKEND, but only
+by locating the packages: numpy, numba and the compiled kernels (dp_kernel_numba) are
+imported on the first numba solve, so importing this module stays cheap.
+"""
+
+import os
+from array import array
+from importlib.util import find_spec
+
+from algorithms.item_table import INT64_MAX
+
+
+DP_BACKEND = 'numba' if find_spec('numba') and find_spec('numpy') else 'python'
+
+# Tables smaller than this (n x (W + 1) cells) use the Python kernel: loading
+# numpy/numba and the compiled kernel costs ~0.5 s per process, about what
+# the Python loops need for 4M cells
+NUMBA_MIN_CELLS = int(os.environ.get('KNAPSACK_NUMBA_MIN_CELLS', 2_000_000))
+
+_numba_solve = None
+
+
+def _load_numba():
+    """Import the compiled kernels once, on first use"""
+    global _numba_solve
+    if _numba_solve is None:
+        try:
+            from algorithms.dp_kernel_numba import dp_solve_numba
+        except ImportError as e:
+            raise ValueError(f'The numba DP backend requires numba and numpy ({e})')
+        _numba_solve = dp_solve_numba
+    return _numba_solve
+
+
+def _fill_python(weights, values, capacity):
+    """dp[i][w] = max value using first i items with capacity w"""
+    dp = [[0] * (capacity + 1)]
+
+    for i in range(1, len(weights) + 1):
+        weight = weights[i - 1]
+        value = values[i - 1]
+        prev = dp[i - 1]
+
+        # Don't include item
+        row = prev[:]
+
+        # Include item if possible
+        for w in range(weight, capacity + 1):
+            candidate = value + prev[w - weight]
+            if candidate > row[w]:
+                row[w] = candidate
+
+        dp.append(row)
+
+    return dp
+
+
+def _backtrack_python(dp, weights, capacity):
+    """Selected item indices (last item first) and dp value at each pick"""
+    selected = []
+    profits = []
+    w = capacity
+
+    for i in range(len(weights), 0, -1):
+        if dp[i][w] != dp[i-1][w]:
+            selected.append(i - 1)
+            profits.append(dp[i][w])
+            w -= weights[i - 1]
+
+    return dp[len(weights)][capacity], selected, profits
+
+
+def select_backend(weights, values, capacity):
+    """
+    Backend for one solve: DP_BACKEND, unless the table is below
+    NUMBA_MIN_CELLS or the columns do not fit the compiled kernel's
+    int64/float64 arrays (big-int list columns, or integer profits that
+    could overflow int64)
+    """
+    if len(weights) * (capacity + 1) < NUMBA_MIN_CELLS:
+        return 'python'
+    if DP_BACKEND == 'numba' and isinstance(weights, array) and isinstance(values, array):
+        if values.typecode == 'd' or sum(values) <= INT64_MAX:
+            return 'numba'
+    return 'python'
+
+
+def dp_solve(weights, values, capacity, backend=None):
+    """
+    Fill the DP table and backtrack it with the requested backend
+    (select_backend() by default). Returns (max_profit, selected, profits)
+    as Python scalars and lists, selected listing the last picked item first.
+    """
+    backend = backend or select_backend(weights, values, capacity)
+
+    if backend == 'numba':
+        return _load_numba()(weights, values, capacity)
+
+    if backend == 'python':
+        dp = _fill_python(weights, values, capacity)
+        return _backtrack_python(dp, weights, capacity)
+
+    raise ValueError(f'Unknown DP backend: {backend}')
@@ -0,0 +1,56 @@
+"""
+Numba-compiled DP kernels, imported lazily by dp_kernel
+
+Importing numpy and numba (and loading the cached machine code) takes far
+longer than a small solve, so this module is only loaded on the first
+solve that uses the numba backend.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _fill_numba(weights, values, capacity):
+    n = weights.shape[0]
+    dp = np.zeros((n + 1, capacity + 1), dtype=values.dtype)
+
+    for i in range(1, n + 1):
+        weight = weights[i - 1]
+        value = values[i - 1]
+        for w in range(capacity + 1):
+            best = dp[i - 1, w]
+            if weight <= w:
+                candidate = value + dp[i - 1, w - weight]
+                if candidate > best:
+                    best = candidate
+            dp[i, w] = best
+
+    return dp
+
+
+@njit(cache=True)
+def _backtrack_numba(dp, weights, capacity):
+    n = weights.shape[0]
+    selected = np.empty(n, dtype=np.int64)
+    profits = np.empty(n, dtype=dp.dtype)
+    count = 0
+    w = capacity
+
+    for i in range(n, 0, -1):
+        if dp[i, w] != dp[i - 1, w]:
+            selected[count] = i - 1
+            profits[count] = dp[i, w]
+            count += 1
+            w -= weights[i - 1]
+
+    return selected[:count], profits[:count]
+
+
+def dp_solve_numba(weights, values, capacity):
+    """Fill and backtrack on the compiled kernels; returns Python scalars and lists"""
+    np_weights = np.asarray(weights, dtype=np.int64)
+    np_values = np.asarray(values, dtype=np.int64 if values.typecode == 'q' else np.float64)
+    dp = _fill_numba(np_weights, np_values, capacity)
+    selected, profits = _backtrack_numba(dp, np_weights, capacity)
+    return dp[len(weights), capacity].item(), selected.tolist(), profits.tolist()
@@ -0,0 +1,94 @@
+import os
+import mmap
+import shutil
+import tempfile
+import time
+
+from algorithms.item_table import ItemTable
+
+
+# Scratch location and disk budget for the decision table file
+SCRATCH_DIR = os.environ.get('KNAPSACK_SCRATCH_DIR') or tempfile.gettempdir()
+DISK_BUDGET_BYTES = int(os.environ.get('KNAPSACK_DISK_BUDGET_BYTES', 8 * 1024 ** 3))
+
+
+def solve_dp_out_of_core(items, capacity, include_steps=True, item_indices=False,
+                         scratch_dir=None, disk_budget=None):
+    """
+    Dynamic Programming - Out-of-Core Tabulation (0/1 Knapsack)
+    Keeps one DP row in memory and writes each row's 'include' decisions
+    as packed bits to a memory-mapped scratch file, row by row. The
+    backtrack then reads the file in reverse, one byte per row.
+    Time Complexity: O(n × W)
+    Space Complexity: O(W) in memory, n × W bits on disk
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
+    capacity = int(capacity)
+    scratch_dir = scratch_dir or SCRATCH_DIR
+    disk_budget = DISK_BUDGET_BYTES if disk_budget is None else disk_budget
+
+    row_bytes = (capacity + 1 + 7) // 8
+    table_bytes = n * row_bytes
+
+    if table_bytes > disk_budget:
+        raise ValueError(
+            f'Decision table needs {table_bytes} bytes, over the disk budget of {disk_budget} bytes'
+        )
+    free_bytes = shutil.disk_usage(scratch_dir).free
+    if table_bytes > free_bytes:
+        raise ValueError(
+            f'Decision table needs {table_bytes} bytes, only {free_bytes} bytes free in {scratch_dir}'
+        )
+
+    row = [0] * (capacity + 1)
+    selected = []
+
+    with tempfile.TemporaryFile(dir=scratch_dir) as scratch:
+        if table_bytes:
+            scratch.truncate(table_bytes)
+            with mmap.mmap(scratch.fileno(), table_bytes) as decisions:
+                # Fill: one in-memory row, decisions appended sequentially
+                for i in range(n):
+                    weight = weights[i]
+                    value = values[i]
+                    bits = bytearray(row_bytes)
+                    for w in range(capacity, weight - 1, -1):
+                        candidate = row[w - weight] + value
+                        if candidate > row[w]:
+                            row[w] = candidate
+                            bits[w >> 3] |= 1 << (w & 7)
+                    decisions[i * row_bytes:(i + 1) * row_bytes] = bits
+
+                # Backtrack: rows read in reverse order
+                w = capacity
+                for i in range(n - 1, -1, -1):
+                    if decisions[i * row_bytes + (w >> 3)] >> (w & 7) & 1:
+                        selected.append(i)
+                        w -= weights[i]
+
+    selected.reverse()
+    max_profit = row[capacity]
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'dp-out-of-core',
+        'steps': steps,
+        'scratch': {
+            'tableBytes': table_bytes,
+            'diskBudget': disk_budget
+        }
+    }
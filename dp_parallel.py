@@ -0,0 +1,155 @@
+import os
+import time
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from algorithms.item_table import ItemTable, INT64_MAX
+
+
+# Smallest capacity slice worth a task; a multiple of 8 so slices own whole decision bytes
+MIN_CHUNK = 1 << 14
+
+# Shared blocks attached in the current process (pool worker or parent)
+_shared = {}
+
+
+def _attach(row_names, decision_name, typecode, row_bytes):
+    """Attach to the shared DP rows and decision bits by name"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in (*row_names, decision_name)]
+    _shared['blocks'] = blocks
+    _shared['rows'] = [block.buf.cast(typecode) for block in blocks[:2]]
+    _shared['decisions'] = blocks[2].buf
+    _shared['typecode'] = typecode
+    _shared['row_bytes'] = row_bytes
+
+
+def _detach():
+    """Release the views and close the shared blocks in this process"""
+    for view in _shared.pop('rows', []):
+        view.release()
+    _shared.pop('decisions', None)
+    for block in _shared.pop('blocks', []):
+        block.close()
+
+
+def _read(view, lo, hi):
+    """Copy view[lo:hi] into a list (via array, much faster than memoryview.tolist)"""
+    out = array(_shared['typecode'])
+    out.frombytes(view[lo:hi].cast('B'))
+    return out.tolist()
+
+
+def _update_chunk(task):
+    """
+    Row i of the DP restricted to capacities lo..hi-1. Reads row i-1 and
+    writes row i in place in shared memory (the two rows alternate), and
+    records the 'include' decisions as packed bits.
+    """
+    i, lo, hi, weight, value = task
+    prev = _shared['rows'][(i - 1) % 2]
+    cur = _shared['rows'][i % 2]
+
+    # Copy the prev slice the chunk reads (and overwrites) into a local list
+    # once, then update it in place in descending order, as a 1D 0/1 row.
+    # base is a multiple of 8 (like lo), so bit w of `bits` is local index w
+    # and the chunk's decisions are whole bytes from start // 8.
+    base = max(0, lo - weight) & ~7
+    start = lo - base
+    row = _read(prev, base, hi)
+    bits = bytearray((hi - base + 7) // 8)
+
+    for w in range(hi - base - 1, max(start, weight) - 1, -1):
+        candidate = row[w - weight] + value
+        if candidate > row[w]:
+            row[w] = candidate
+            bits[w >> 3] |= 1 << (w & 7)
+
+    cur[lo:hi] = array(_shared['typecode'], row[start:])
+    bits = bits[start >> 3:]
+    offset = (i - 1) * _shared['row_bytes'] + lo // 8
+    _shared['decisions'][offset:offset + len(bits)] = bits
+
+
+def solve_dp_parallel(items, capacity, include_steps=True, item_indices=False, workers=None):
+    """
+    Dynamic Programming - Parallel Wavefront (0/1 Knapsack)
+    Each row's capacity range is split into chunks that a process pool
+    updates concurrently. The previous/current rows and the packed decision
+    bits live in multiprocessing.shared_memory, so rows are never copied
+    between workers.
+    Time Complexity: O(n × W / workers)
+    Space Complexity: O(W) for the rows + O(n × W) bits for the decisions
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
+    capacity = int(capacity)
+    workers = workers or os.cpu_count() or 1
+
+    if not isinstance(values, array) or (values.typecode == 'q' and sum(values) > INT64_MAX):
+        raise ValueError('dp-parallel needs item values and profits that fit in 64 bits')
+    typecode = values.typecode
+    row_bytes = (capacity + 1 + 7) // 8
+    chunk = max(MIN_CHUNK, -(-(capacity + 1) // workers))
+    chunk = -(-chunk // 8) * 8
+    bounds = [(lo, min(lo + chunk, capacity + 1)) for lo in range(0, capacity + 1, chunk)]
+    workers = min(workers, len(bounds))
+
+    rows = [shared_memory.SharedMemory(create=True, size=8 * (capacity + 1)) for _ in range(2)]
+    decisions = shared_memory.SharedMemory(create=True, size=max(1, n * row_bytes))
+    init_args = ([row.name for row in rows], decisions.name, typecode, row_bytes)
+
+    try:
+        rows[0].buf[:8 * (capacity + 1)] = bytes(8 * (capacity + 1))
+
+        if workers > 1:
+            with Pool(workers, initializer=_attach, initargs=init_args) as pool:
+                for i in range(1, n + 1):
+                    pool.map(_update_chunk, [
+                        (i, lo, hi, weights[i - 1], values[i - 1]) for lo, hi in bounds
+                    ])
+        else:
+            _attach(*init_args)
+            try:
+                for i in range(1, n + 1):
+                    for lo, hi in bounds:
+                        _update_chunk((i, lo, hi, weights[i - 1], values[i - 1]))
+            finally:
+                _detach()
+
+        final_row = rows[n % 2].buf.cast(typecode)
+        max_profit = final_row[capacity]
+        final_row.release()
+
+        # Backtrack through the packed decision bits
+        selected = []
+        w = capacity
+        for i in range(n, 0, -1):
+            if decisions.buf[(i - 1) * row_bytes + (w >> 3)] >> (w & 7) & 1:
+                selected.append(i - 1)
+                w -= weights[i - 1]
+        selected.reverse()
+    finally:
+        for block in (*rows, decisions):
+            block.close()
+            block.unlink()
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'dp-parallel',
+        'steps': steps,
+        'workers': workers,
+        'chunks': len(bounds)
+    }
@@ -1,77 +1,105 @@
 import time
 
+from algorithms.item_table import ItemTable
+from algorithms.dp_kernel import dp_solve, select_backend
 
-def solve_dp_tabulation(items, capacity):
+
+def _subset_sum_bitset(weights, capacity):
+    """
+    Subset-sum reachability for value == weight instances: bit s of the
+    big-int bitset is set when some subset weighs exactly s. Keeps the
+    bitset before each item so the chosen items can be backtracked.
+    Returns (selected indices, best reachable weight).
+    """
+    mask = (1 << (capacity + 1)) - 1
+    reach = 1
+    history = []
+    
+    for weight in weights:
+        history.append(reach)
+        reach = (reach | (reach << weight)) & mask
+        if reach >> capacity:
+            break  # Hold filled exactly - later items are not needed
+    
+    best = reach.bit_length() - 1
+    
+    # Item i is needed when the remaining target was unreachable without it
+    selected = []
+    target = best
+    for i in range(len(history) - 1, -1, -1):
+        if not history[i] >> target & 1:
+            selected.append(i)
+            target -= weights[i]
+    
+    selected.reverse()
+    return selected, best
+
+
+def solve_dp_tabulation(items, capacity, include_steps=True, item_indices=False):
     """
     Dynamic Programming - Bottom-up Tabulation (0/1 Knapsack)
-    Uses 2D table to build solution from bottom up
+    Uses 2D table to build solution from bottom up, on the compiled
+    kernel from dp_kernel when available (reported as 'backend')
     Time Complexity: O(n × W)
     Space Complexity: O(n × W)
     """
     start_time = time.perf_counter()  # ✅ CHANGED
     
-    n = len(items)
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
     capacity = int(capacity)
     
-    # Convert weights to integers
-    int_items = []
-    for item in items:
-        int_items.append({
-            **item,
-            'weight': int(item['weight'])
-        })
-    
-    # Create DP table: dp[i][w] = max value using first i items with capacity w
-    dp = [[0 for _ in range(capacity + 1)] for _ in range(n + 1)]
-    
-    # Fill the DP table
-    for i in range(1, n + 1):
-        item = int_items[i - 1]
-        weight = item['weight']
-        value = item['value']
+    # Pure fill-the-hold instances reduce to subset sum on a bitset
+    if n and all(values[i] == weights[i] for i in range(n)):
+        selected, max_profit = _subset_sum_bitset(weights, capacity)
+        steps = table.include_steps(selected) if include_steps else []
+        
+        execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
         
-        for w in range(capacity + 1):
-            # Don't include item
-            dp[i][w] = dp[i-1][w]
-            
-            # Include item if possible
-            if weight <= w:
-                dp[i][w] = max(dp[i][w], value + dp[i-1][w-weight])
+        return {
+            'maxProfit': max_profit,
+            'totalWeight': max_profit,
+            **table.selection(selected),
+            'executionTime': round(execution_time, 2),
+            'algorithm': 'dp-tabulation',
+            'steps': steps,
+            'fastPath': 'subset-sum-bitset',
+            'backend': 'python'
+        }
     
-    # Backtrack to find selected items
-    selected_items = []
-    steps = []
-    w = capacity
+    # Fill and backtrack the DP table on the fastest available kernel
+    backend = select_backend(weights, values, capacity)
+    max_profit, selected, profits = dp_solve(weights, values, capacity, backend)
     
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i-1][w]:
-            item = int_items[i-1]
-            selected_items.append({
-                **item,
-                'selected': True,
-                'fraction': 1.0
-            })
+    steps = []
+    if include_steps:
+        w = capacity
+        for i, profit in zip(selected, profits):
+            echo_weight, echo_value = table.echo(i)
             steps.append({
                 'stepNumber': len(steps) + 1,
-                'description': f"✓ Selected {item['item']} (Value: ${item['value']}, Weight: {item['weight']})",
-                'currentWeight': capacity - w + item['weight'],
-                'currentProfit': dp[i][w],
+                'description': f"✓ Selected {table.names[i]} (Value: ${echo_value}, Weight: {echo_weight})",
+                'currentWeight': capacity - w + weights[i],
+                'currentProfit': profit,
                 'decision': 'include'
             })
-            w -= item['weight']
+            w -= weights[i]
     
-    selected_items.reverse()
+    selected.reverse()
     steps.reverse()
     
     execution_time = (time.perf_counter() - start_time) * 1_000_000  # ✅ CHANGED to microseconds
     
-    total_weight = sum(item['weight'] for item in selected_items)
+    total_weight = table.total_weight(selected)
     
     return {
-        'maxProfit': round(dp[n][capacity], 2),
+        'maxProfit': round(max_profit, 2),
         'totalWeight': round(total_weight, 2),
-        'selectedItems': selected_items,
+        **table.selection(selected),
         'executionTime': round(execution_time, 2),
         'algorithm': 'dp-tabulation',
-        'steps': steps
+        'steps': steps,
+        'backend': backend
     }
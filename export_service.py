@@ -1,76 +1,175 @@
 """
-Export service for generating JSON and CSV outputs
+Export service for generating JSON, CSV and NDJSON outputs
+
+The iter_* exporters are generators that yield the document piece by piece,
+so large selections can be streamed without holding full copies in memory.
 """
 
 import json
 import csv
+import zlib
 from io import StringIO
 
 
-def export_to_json(result, include_steps=False):
-    """Export result to JSON format"""
-    output = {
-        'algorithm': result['algorithm'],
-        'maxProfit': result['maxProfit'],
-        'totalWeight': result['totalWeight'],
-        'executionTime': result['executionTime'],
-        'selectedItems': result['selectedItems']
-    }
-    
+CSV_FIELDNAMES = ['item', 'weight', 'value', 'selected', 'fraction']
+COMPARISON_FIELDNAMES = ['algorithm', 'maxProfit', 'totalWeight', 'executionTime', 'itemsSelected']
+RESULT_FIELDS = ('algorithm', 'maxProfit', 'totalWeight', 'executionTime', 'selectedItems')
+ITEM_FIELDS = ('item', 'weight', 'value')
+
+
+def _check_results(results, item_fields=()):
+    """
+    Raise ValueError when a result lacks a field the exporter reads. Called
+    before the first yield, so a malformed result fails before any output
+    (and before the streamed response has sent its 200 headers).
+    """
+    for index, result in enumerate(results, start=1):
+        missing = [key for key in RESULT_FIELDS if key not in result]
+        if missing:
+            raise ValueError(f"Result {index} is missing field(s): {', '.join(missing)}")
+
+        for item in result['selectedItems']:
+            missing = [key for key in item_fields if key not in item]
+            if missing:
+                raise ValueError(f"Result {index} has a selected item missing field(s): {', '.join(missing)}")
+
+
+class _CsvRowEncoder:
+    """Encode one CSV row at a time through a small reusable buffer"""
+
+    def __init__(self, fieldnames):
+        self._buffer = StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=fieldnames)
+
+    def _flush(self):
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+    def header(self):
+        self._writer.writeheader()
+        return self._flush()
+
+    def row(self, row):
+        self._writer.writerow(row)
+        return self._flush()
+
+
+def iter_json(result, include_steps=False):
+    """Stream result as a JSON document, one selected item per chunk"""
+    _check_results([result])
+
+    yield '{\n' + ''.join(
+        f'  {json.dumps(key)}: {json.dumps(result[key])},\n'
+        for key in ('algorithm', 'maxProfit', 'totalWeight', 'executionTime')
+    )
+
+    yield '  "selectedItems": ['
+    for i, item in enumerate(result['selectedItems']):
+        yield (',\n    ' if i else '\n    ') + json.dumps(item)
+    yield '\n  ]' if result['selectedItems'] else ']'
+
     if include_steps and 'steps' in result and result['steps']:
-        output['steps'] = result['steps']
-    
-    return json.dumps(output, indent=2)
+        yield ',\n  "steps": ['
+        for i, step in enumerate(result['steps']):
+            yield (',\n    ' if i else '\n    ') + json.dumps(step)
+        yield '\n  ]'
 
+    yield '\n}'
+
+
+def iter_csv(result):
+    """Stream selected items as CSV rows, followed by the summary block"""
+    _check_results([result], ITEM_FIELDS)
 
-def export_to_csv(result):
-    """Export selected items to CSV format"""
-    output = StringIO()
-    
     if not result['selectedItems']:
-        return "No items selected"
-    
-    # Define CSV columns
-    fieldnames = ['item', 'weight', 'value', 'selected', 'fraction']
-    
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
+        yield "No items selected"
+        return
+
+    summary = (
+        f"\nSummary:\n"
+        f"Algorithm,{result['algorithm']}\n"
+        f"Max Profit,${result['maxProfit']}\n"
+        f"Total Weight,{result['totalWeight']} kg\n"
+        f"Execution Time,{result['executionTime']} ms\n"
+    )
+
+    encoder = _CsvRowEncoder(CSV_FIELDNAMES)
+    yield encoder.header()
+
     for item in result['selectedItems']:
-        writer.writerow({
+        yield encoder.row({
             'item': item['item'],
             'weight': item['weight'],
             'value': item['value'],
             'selected': item.get('selected', True),
             'fraction': item.get('fraction', 1.0)
         })
-    
+
     # Add summary row
-    output.write(f"\nSummary:\n")
-    output.write(f"Algorithm,{result['algorithm']}\n")
-    output.write(f"Max Profit,${result['maxProfit']}\n")
-    output.write(f"Total Weight,{result['totalWeight']} kg\n")
-    output.write(f"Execution Time,{result['executionTime']} ms\n")
-    
-    return output.getvalue()
+    yield summary
 
 
-def export_comparison_to_csv(results):
-    """Export algorithm comparison to CSV"""
-    output = StringIO()
-    
-    fieldnames = ['algorithm', 'maxProfit', 'totalWeight', 'executionTime', 'itemsSelected']
-    
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
+def iter_comparison_csv(results):
+    """Stream algorithm comparison as CSV rows"""
+    _check_results(results)
+
+    encoder = _CsvRowEncoder(COMPARISON_FIELDNAMES)
+    yield encoder.header()
+
     for result in results:
-        writer.writerow({
+        yield encoder.row({
             'algorithm': result['algorithm'],
             'maxProfit': result['maxProfit'],
             'totalWeight': result['totalWeight'],
             'executionTime': result['executionTime'],
             'itemsSelected': len(result['selectedItems'])
         })
-    
-    return output.getvalue()
+
+
+def iter_ndjson(results):
+    """
+    Stream results as NDJSON: one line per selected item tagged with its
+    result index, then one summary line per result
+    """
+    _check_results(results)
+
+    for index, result in enumerate(results):
+        for item in result['selectedItems']:
+            yield json.dumps({'type': 'item', 'result': index, **item}) + '\n'
+
+        yield json.dumps({
+            'type': 'summary',
+            'result': index,
+            'algorithm': result['algorithm'],
+            'maxProfit': result['maxProfit'],
+            'totalWeight': result['totalWeight'],
+            'executionTime': result['executionTime'],
+            'itemsSelected': len(result['selectedItems'])
+        }) + '\n'
+
+
+def gzip_stream(chunks, level=6):
+    """Gzip-compress a stream of text chunks on the fly"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_to_json(result, include_steps=False):
+    """Export result to JSON format"""
+    return ''.join(iter_json(result, include_steps))
+
+
+def export_to_csv(result):
+    """Export selected items to CSV format"""
+    return ''.join(iter_csv(result))
+
+
+def export_comparison_to_csv(results):
+    """Export algorithm comparison to CSV"""
+    return ''.join(iter_comparison_csv(results))
@@ -0,0 +1,105 @@
+import time
+
+from algorithms.item_table import ItemTable
+
+
+DEFAULT_EPSILON = 0.1
+
+
+def _fractional_bound(weights, values, ratios, candidates, capacity):
+    """Fractional (LP relaxation) optimum - an upper bound on the 0/1 optimum"""
+    bound = 0
+    remaining = capacity
+    for i in sorted(candidates, key=ratios.__getitem__, reverse=True):
+        if weights[i] <= remaining:
+            remaining -= weights[i]
+            bound += values[i]
+        else:
+            bound += remaining * ratios[i]
+            break
+    return bound
+
+
+def solve_fptas(items, capacity, include_steps=True, item_indices=False, epsilon=DEFAULT_EPSILON):
+    """
+    Fully Polynomial-Time Approximation Scheme (0/1 Knapsack)
+    Scales values down by K = epsilon * LB / n, where LB is half the
+    fractional bound (a lower bound on the optimum), and runs the
+    profit-indexed DP (minimum weight per scaled profit) over at most
+    2n / epsilon scaled profits. The selection is a feasible 0/1 loading
+    worth at least (1 - epsilon) of the optimum.
+    Time Complexity: O(n² / epsilon)
+    Space Complexity: O(n² / epsilon) bits
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    capacity = int(capacity)
+    epsilon = float(epsilon)
+
+    # Items that cannot fit on their own never appear in a solution
+    candidates = [i for i in range(len(table)) if weights[i] <= capacity]
+    max_value = max((values[i] for i in candidates), default=0)
+    upper_bound = _fractional_bound(weights, values, table.ratios, candidates, capacity)
+
+    selected = []
+    if max_value > 0:
+        # The fractional bound is at most OPT + max_value <= 2 * OPT, so half
+        # of it is a lower bound and the profit axis stays O(n / epsilon)
+        lower_bound = upper_bound / 2
+        scale = epsilon * lower_bound / len(candidates)
+        profits = [int(values[i] // scale) for i in candidates]
+
+        # No feasible set can have scaled profit above the fractional bound
+        max_scaled = min(sum(profits), int(upper_bound // scale))
+
+        # min_weight[q] = lightest subset of the items seen so far with scaled profit q
+        unreachable = capacity + 1
+        min_weight = [0] + [unreachable] * max_scaled
+        decisions = []
+
+        for k, i in enumerate(candidates):
+            profit = profits[k]
+            weight = weights[i]
+            bits = bytearray(max_scaled // 8 + 1)
+            if profit > 0:
+                for q in range(max_scaled, profit - 1, -1):
+                    candidate = min_weight[q - profit] + weight
+                    if candidate < min_weight[q]:
+                        min_weight[q] = candidate
+                        bits[q >> 3] |= 1 << (q & 7)
+            decisions.append(bits)
+
+        best = max(q for q in range(max_scaled + 1) if min_weight[q] <= capacity)
+
+        # Backtrack through the per-item decision bits
+        q = best
+        for k in range(len(candidates) - 1, -1, -1):
+            if decisions[k][q >> 3] >> (q & 7) & 1:
+                selected.append(candidates[k])
+                q -= profits[k]
+        selected.reverse()
+
+    max_profit = sum(values[i] for i in selected)
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'fptas',
+        'steps': steps,
+        'epsilon': epsilon,
+        'guarantee': {
+            'approximationRatio': round(1 - epsilon, 6),
+            'optimumUpperBound': round(min(upper_bound, max_profit / (1 - epsilon)), 2)
+        }
+    }
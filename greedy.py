@@ -1,7 +1,10 @@
+import random
 import time
 
+from algorithms.item_table import ItemTable
 
-def solve_greedy(items, capacity):
+
+def solve_greedy(items, capacity, include_steps=True, item_indices=False):
     """
     Greedy Algorithm for Fractional Knapsack
     Sorts items by value/weight ratio and selects greedily
@@ -9,78 +12,163 @@ def solve_greedy(items, capacity):
     """
     start_time = time.perf_counter()  # ✅ CHANGED
     
-    # Calculate value-to-weight ratio for each item
-    for item in items:
-        if item['weight'] > 0:
-            item['ratio'] = item['value'] / item['weight']
-        else:
-            item['ratio'] = 0
+    # Value-to-weight ratios are computed once by the item table
+    table = ItemTable(items, integral_weights=False, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    ratios = table.ratios
+    names = table.names
     
-    # Sort by ratio in descending order
-    sorted_items = sorted(items, key=lambda x: x['ratio'], reverse=True)
+    # Sort item indices by ratio in descending order
+    order = sorted(range(len(table)), key=ratios.__getitem__, reverse=True)
     
     total_weight = 0
     total_value = 0
-    selected_items = []
+    selected = []
+    fractions = []
     steps = []
     
     # Select items greedily
-    for i, item in enumerate(sorted_items):
-        if total_weight + item['weight'] <= capacity:
+    for i, idx in enumerate(order):
+        weight = weights[idx]
+        if total_weight + weight <= capacity:
             # Include full item
-            total_weight += item['weight']
-            total_value += item['value']
-            selected_items.append({
-                **item,
-                'selected': True,
-                'fraction': 1.0
-            })
-            steps.append({
-                'stepNumber': i + 1,
-                'description': f"✓ Including {item['item']} (Weight: {item['weight']}, Value: ${item['value']}, Ratio: {item['ratio']:.2f})",
-                'currentWeight': total_weight,
-                'currentProfit': total_value,
-                'decision': 'include'
-            })
+            total_weight += weight
+            total_value += values[idx]
+            selected.append(idx)
+            fractions.append(1.0)
+            if include_steps:
+                echo_weight, echo_value = table.echo(idx)
+                steps.append({
+                    'stepNumber': i + 1,
+                    'description': f"✓ Including {names[idx]} (Weight: {echo_weight}, Value: ${echo_value}, Ratio: {ratios[idx]:.2f})",
+                    'currentWeight': total_weight,
+                    'currentProfit': total_value,
+                    'decision': 'include'
+                })
         elif total_weight < capacity:
             # Fractional knapsack - include partial item
             remaining_capacity = capacity - total_weight
-            fraction = remaining_capacity / item['weight']
-            partial_value = item['value'] * fraction
+            fraction = remaining_capacity / weight
+            partial_value = values[idx] * fraction
             
             total_value += partial_value
             total_weight = capacity
             
-            selected_items.append({
-                **item,
-                'selected': True,
-                'fraction': fraction
-            })
-            steps.append({
-                'stepNumber': i + 1,
-                'description': f"⚡ Partially including {item['item']} ({fraction*100:.0f}% of item)",
-                'currentWeight': total_weight,
-                'currentProfit': total_value,
-                'decision': 'partial'
-            })
+            selected.append(idx)
+            fractions.append(fraction)
+            if include_steps:
+                steps.append({
+                    'stepNumber': i + 1,
+                    'description': f"⚡ Partially including {names[idx]} ({fraction*100:.0f}% of item)",
+                    'currentWeight': total_weight,
+                    'currentProfit': total_value,
+                    'decision': 'partial'
+                })
             break
-        else:
+        elif include_steps:
             # Skip item
             steps.append({
                 'stepNumber': i + 1,
-                'description': f"✗ Skipping {item['item']} (exceeds capacity)",
+                'description': f"✗ Skipping {names[idx]} (exceeds capacity)",
                 'currentWeight': total_weight,
                 'currentProfit': total_value,
                 'decision': 'skip'
             })
+        else:
+            # Hold is full - remaining items would only produce skip steps
+            break
     
     execution_time = (time.perf_counter() - start_time) * 1_000_000  # ✅ CHANGED to microseconds (µs)
     
     return {
         'maxProfit': round(total_value, 2),
         'totalWeight': round(total_weight, 2),
-        'selectedItems': selected_items,
+        **table.selection(selected, fractions, with_ratio=True),
         'executionTime': round(execution_time, 2),
         'algorithm': 'greedy',
         'steps': steps
     }
+
+
+def _split_at_break(candidates, weights, ratios, capacity):
+    """
+    Linear-time selection of the greedy prefix: partitions around random
+    ratio pivots (quickselect) instead of sorting. Returns the items of the
+    ratio-ordered prefix that fits and the break item (None if all fit).
+    """
+    taken = []
+    remaining = capacity
+
+    while candidates:
+        pivot = ratios[random.choice(candidates)]
+        higher = [i for i in candidates if ratios[i] > pivot]
+        higher_weight = sum(weights[i] for i in higher)
+
+        if higher_weight > remaining:
+            # Break item has a ratio above the pivot
+            candidates = higher
+            continue
+
+        taken.extend(higher)
+        remaining -= higher_weight
+
+        for i in candidates:
+            if ratios[i] == pivot:
+                if weights[i] > remaining:
+                    return taken, i
+                taken.append(i)
+                remaining -= weights[i]
+
+        candidates = [i for i in candidates if ratios[i] < pivot]
+
+    return taken, None
+
+
+def solve_greedy_01(items, capacity, include_steps=True, item_indices=False):
+    """
+    Greedy Algorithm for 0/1 Knapsack (1/2-approximation)
+    Takes the better of the greedy ratio prefix and the best single item,
+    finding the break item with quickselect instead of a full sort
+    Time Complexity: O(n) expected
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    capacity = int(capacity)
+
+    # Items heavier than the hold can never be loaded
+    candidates = [i for i in range(len(table)) if weights[i] <= capacity]
+
+    prefix, break_item = _split_at_break(candidates, weights, table.ratios, capacity)
+    prefix_value = sum(values[i] for i in prefix)
+    best_single = max(candidates, key=values.__getitem__, default=None)
+
+    if best_single is not None and values[best_single] > prefix_value:
+        selected = [best_single]
+        strategy = 'best-single-item'
+    else:
+        selected = sorted(prefix)
+        strategy = 'greedy-prefix'
+
+    max_profit = sum(values[i] for i in selected)
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'greedy-01',
+        'steps': steps,
+        'strategy': strategy,
+        'breakItem': table.names[break_item] if break_item is not None else None,
+        'guarantee': {'approximationRatio': 0.5}
+    }
@@ -0,0 +1,186 @@
+"""
+Columnar item container shared by the solver engines
+"""
+
+from array import array
+
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Integers up to 2**53 convert to float (and back) without losing precision
+FLOAT_EXACT = 1 << 53
+
+
+def _int_column(numbers):
+    """Pack Python ints into array('q') when all fit in int64, else keep a list"""
+    if all(INT64_MIN <= x <= INT64_MAX for x in numbers):
+        return array('q', numbers)
+    return numbers
+
+
+def _column(numbers):
+    """
+    Pack numbers into array('q') when all are integral and fit in int64,
+    else array('d') when every number is exactly representable as a float.
+    Anything else (big ints mixed with fractions) stays a list, so Python
+    ints are never rounded through float.
+    """
+    if isinstance(numbers, array) and numbers.typecode == 'q':
+        return numbers
+
+    packed = []
+    integral = True
+    for x in numbers:
+        if not isinstance(x, int):
+            x = float(x)
+            if x.is_integer() and abs(x) < FLOAT_EXACT:
+                x = int(x)
+            else:
+                integral = False
+        packed.append(x)
+
+    if integral:
+        return _int_column(packed)
+    if all(isinstance(x, float) or abs(x) <= FLOAT_EXACT for x in packed):
+        return array('d', packed)
+    return packed
+
+
+def _ratios(weights, values):
+    """Value-to-weight ratio column (0 for zero-weight items)"""
+    ratios = array('d', bytes(8 * len(weights)))
+    for i in range(len(weights)):
+        if weights[i] > 0:
+            ratios[i] = values[i] / weights[i]
+    return ratios
+
+
+class ItemTable:
+    """
+    Parallel weight/value/ratio columns parsed once from the request items.
+    Columns are compact arrays when the numbers allow it, and plain lists
+    of exact Python ints otherwise (see _column).
+    Item i is described by weights[i], values[i], ratios[i] and names[i];
+    result dicts are only built for the selected items via selection(),
+    or skipped entirely when the caller asked for item indices.
+
+    `items` may be a list of item dicts or another ItemTable (for example
+    one built by the manifest importer), in which case its columns are
+    reused without going through dicts.
+    """
+
+    __slots__ = ('names', 'weights', 'values', 'ratios', 'item_indices', '_source', '_truncated')
+
+    def __init__(self, items, integral_weights=True, item_indices=False):
+        if isinstance(items, ItemTable):
+            names = items.names
+            raw_weights = items.weights
+            values = items.values
+            source = items._source
+        else:
+            names = [item['item'] for item in items]
+            raw_weights = _column([item['weight'] for item in items])
+            values = _column([item['value'] for item in items])
+            source = items
+
+        if integral_weights and not (isinstance(raw_weights, array) and raw_weights.typecode == 'q'):
+            weights = _int_column([int(w) for w in raw_weights])
+        else:
+            weights = raw_weights
+
+        self.names = names
+        self.weights = weights
+        self.values = values
+        self.ratios = _ratios(weights, values)
+        self.item_indices = item_indices
+        self._source = source
+        self._truncated = integral_weights
+
+    @classmethod
+    def from_columns(cls, names, weights, values):
+        """Build a table directly from parsed columns, with no source dicts"""
+        table = cls.__new__(cls)
+        table.names = names
+        table.weights = _column(weights)
+        table.values = _column(values)
+        table.ratios = _ratios(table.weights, table.values)
+        table.item_indices = False
+        table._source = None
+        table._truncated = False
+        return table
+
+    def __len__(self):
+        return len(self.weights)
+
+    def echo(self, i):
+        """
+        (weight, value) of item i as the caller wrote them: the source dict's
+        numbers, not the packed columns (which may have turned 23 into 23.0),
+        except that integral_weights tables echo the truncated int weight
+        """
+        if self._source is None:
+            return self.weights[i], self.values[i]
+        item = self._source[i]
+        weight = self.weights[i] if self._truncated else item['weight']
+        return weight, item['value']
+
+    def materialize(self, i, fraction=1.0, with_ratio=False):
+        """Build the result dict for selected item i"""
+        base = self._source[i] if self._source is not None else {'item': self.names[i]}
+        weight, value = self.echo(i)
+        item = {
+            **base,
+            'weight': weight,
+            'value': value,
+            'selected': True,
+            'fraction': fraction
+        }
+        if with_ratio:
+            item['ratio'] = self.ratios[i]
+        return item
+
+    def selection(self, indices, fractions=None, with_ratio=False):
+        """
+        Result fields for the selected items: 'selectedItems' with full item
+        dicts, or 'selectedIndices' in item index mode. In index mode the
+        fractions are only listed when the engine passes them.
+        """
+        if self.item_indices:
+            fields = {'selectedIndices': list(indices)}
+            if fractions is not None:
+                fields['fractions'] = list(fractions)
+            return fields
+
+        if fractions is None:
+            fractions = [1.0] * len(indices)
+
+        return {
+            'selectedItems': [
+                self.materialize(i, fraction, with_ratio)
+                for i, fraction in zip(indices, fractions)
+            ]
+        }
+
+    def include_steps(self, indices):
+        """'include' steps for a selection, with running weight and profit"""
+        steps = []
+        current_weight = 0
+        current_profit = 0
+        for i in indices:
+            weight, value = self.echo(i)
+            current_weight += weight
+            current_profit += value
+            steps.append({
+                'stepNumber': len(steps) + 1,
+                'description': f"✓ Selected {self.names[i]} (Value: ${value}, Weight: {weight})",
+                'currentWeight': current_weight,
+                'currentProfit': current_profit,
+                'decision': 'include'
+            })
+        return steps
+
+    def total_weight(self, indices):
+        """Sum the weight column over the given item indices"""
+        weights = self.weights
+        return sum(weights[i] for i in indices)
@@ -0,0 +1,28 @@
+"""
+JSON response service - fast encoding for large solver results
+"""
+
+import json
+
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def encode_json(payload):
+    """Encode payload compactly, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let the stdlib encoder handle it
+
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+
+
+def json_response(payload, status=200):
+    """Build a Flask JSON response without going through jsonify"""
+    return Response(encode_json(payload), status=status, mimetype='application/json')
@@ -0,0 +1,130 @@
+"""
+Local load test - compare the Flask dev server with the ASGI serving mode
+
+    python app.py                                   # Flask, port 5000
+    uvicorn asgi:app --port 8000                    # ASGI + solver pool
+    python load_test.py http://localhost:5000 http://localhost:8000
+
+Each run mixes slow solver requests (/api/solve on a random instance) with
+cheap reads (/api/presets) from concurrent clients, then reports throughput
+and the latency of the cheap route, which is what a blocked server hurts
+first. 429 responses are counted separately as shed load.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import urllib.request
+import urllib.error
+
+
+def solve_body(n, capacity, algorithm, seed):
+    """Random /api/solve request body"""
+    rng = random.Random(seed)
+    items = [
+        {'item': f'Crate {i}', 'weight': rng.randint(1, 100), 'value': rng.randint(1, 500)}
+        for i in range(n)
+    ]
+    return json.dumps({
+        'items': items,
+        'capacity': capacity,
+        'algorithm': algorithm,
+        'includeSteps': False
+    }).encode()
+
+
+def request(url, body=None):
+    """One request; returns (status, latency in ms)"""
+    start = time.perf_counter()
+    req = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=120) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        status = e.code
+    except OSError:
+        status = 0
+    return status, (time.perf_counter() - start) * 1000
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(base_url, args):
+    """Drive one server and return its summary"""
+    solve_url = base_url.rstrip('/') + '/api/solve'
+    presets_url = base_url.rstrip('/') + '/api/presets'
+    body = solve_body(args.items, args.capacity, args.algorithm, args.seed)
+
+    counter = iter(range(args.requests))
+    lock = threading.Lock()
+    statuses = {}
+    cheap_latency = []
+    solve_latency = []
+
+    def client():
+        while True:
+            with lock:
+                k = next(counter, None)
+            if k is None:
+                return
+            cheap = k % (args.solve_every) != 0
+            status, latency = request(presets_url) if cheap else request(solve_url, body)
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    (cheap_latency if cheap else solve_latency).append(latency)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'url': base_url,
+        'requests': args.requests,
+        'elapsed': round(elapsed, 2),
+        'throughput': round(statuses.get(200, 0) / elapsed, 1),
+        'statuses': statuses,
+        'cheapP50': round(percentile(cheap_latency, 0.5), 1),
+        'cheapP95': round(percentile(cheap_latency, 0.95), 1),
+        'solveP50': round(percentile(solve_latency, 0.5), 1)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('urls', nargs='+', help='server base URLs to compare')
+    parser.add_argument('--requests', type=int, default=400, help='total requests per server')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent clients')
+    parser.add_argument('--solve-every', type=int, default=4, help='one solve request per N requests')
+    parser.add_argument('--algorithm', default='dp-tabulation')
+    parser.add_argument('--items', type=int, default=200)
+    parser.add_argument('--capacity', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'server':<28} {'req/s':>8} {'cheap p50':>10} {'cheap p95':>10} {'solve p50':>10}  statuses")
+    for url in args.urls:
+        summary = run(url, args)
+        print(
+            f"{summary['url']:<28} {summary['throughput']:>8} "
+            f"{summary['cheapP50']:>8}ms {summary['cheapP95']:>8}ms {summary['solveP50']:>8}ms  "
+            f"{summary['statuses']}"
+        )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,215 @@
+import time
+from bisect import bisect_right
+
+from algorithms.item_table import ItemTable
+from algorithms.greedy import solve_greedy_01
+
+
+DEFAULT_TIME_BUDGET_MS = 50
+
+# Lowest-value selected items considered as the pair dropped by a 2-1 swap
+SWAP_21_CANDIDATES = 32
+
+
+class _BestFitIndex:
+    """
+    Max-value segment tree over the items sorted by weight. Only unselected
+    items are active, so best_fit(r) returns the most valuable unselected
+    item weighing at most r in O(log n).
+    """
+
+    def __init__(self, weights, values, active):
+        self.values = values
+        self.order = sorted(range(len(weights)), key=weights.__getitem__)
+        self.sorted_weights = [weights[i] for i in self.order]
+        self.position = [0] * len(weights)
+        for pos, i in enumerate(self.order):
+            self.position[i] = pos
+
+        size = 1
+        while size < max(1, len(weights)):
+            size *= 2
+        self.size = size
+        self.tree = [-1] * (2 * size)  # item index with the best value, -1 if none
+        for pos, i in enumerate(self.order):
+            if active[i]:
+                self.tree[size + pos] = i
+        for node in range(size - 1, 0, -1):
+            self.tree[node] = self._better(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def _better(self, a, b):
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        return a if self.values[a] >= self.values[b] else b
+
+    def _set(self, i, item):
+        node = self.size + self.position[i]
+        self.tree[node] = item
+        node //= 2
+        while node:
+            self.tree[node] = self._better(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def activate(self, i):
+        self._set(i, i)
+
+    def deactivate(self, i):
+        self._set(i, -1)
+
+    def best_fit(self, room):
+        """Most valuable active item with weight <= room, or -1"""
+        lo = self.size
+        hi = self.size + bisect_right(self.sorted_weights, room)
+        best = -1
+        while lo < hi:
+            if lo & 1:
+                best = self._better(best, self.tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                best = self._better(best, self.tree[hi])
+            lo //= 2
+            hi //= 2
+        return best
+
+
+def improve_selection(table, selected, capacity, time_budget_ms=DEFAULT_TIME_BUDGET_MS, started=None):
+    """
+    Improve a feasible selection (item indices into table) with add moves,
+    1-1 swaps (drop one, add one) and 2-1 swaps (drop two, add one) until
+    no move helps or the time budget runs out. Profit and weight are kept
+    as running totals, so each move is evaluated with one O(log n) query.
+    The budget runs from started (a time.perf_counter() value, default now),
+    so a caller can count its own setup against it; building the best-fit
+    index is part of the budget and is also reported as indexTime
+    (microseconds).
+    Returns (selected indices, stats).
+    """
+    weights = table.weights
+    values = table.values
+
+    index_start = time.perf_counter()
+    deadline = (index_start if started is None else started) + time_budget_ms / 1000
+    chosen = set(selected)
+    active = [i not in chosen for i in range(len(table))]
+    index = _BestFitIndex(weights, values, active)
+    room = capacity - sum(weights[i] for i in chosen)
+    index_time = (time.perf_counter() - index_start) * 1_000_000  # microseconds
+
+    moves = {'add': 0, 'swap11': 0, 'swap21': 0}
+    timed_out = False
+
+    def take(j):
+        chosen.add(j)
+        index.deactivate(j)
+
+    def drop(i):
+        chosen.discard(i)
+        index.activate(i)
+
+    improved = True
+    while improved and not timed_out:
+        improved = False
+
+        # Add: fill the remaining room with the most valuable item that fits
+        j = index.best_fit(room)
+        while j >= 0 and values[j] > 0:
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            take(j)
+            room -= weights[j]
+            moves['add'] += 1
+            improved = True
+            j = index.best_fit(room)
+        if timed_out:
+            break
+
+        # 1-1 swap: replace a selected item with a more valuable one that fits
+        for i in sorted(chosen, key=values.__getitem__):
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+            j = index.best_fit(room + weights[i])
+            if j >= 0 and values[j] > values[i]:
+                drop(i)
+                take(j)
+                room += weights[i] - weights[j]
+                moves['swap11'] += 1
+                improved = True
+        if improved or timed_out:
+            continue
+
+        # 2-1 swap: replace two cheap selected items with one better item
+        cheapest = sorted(chosen, key=values.__getitem__)[:SWAP_21_CANDIDATES]
+        for a in range(len(cheapest)):
+            for b in range(a + 1, len(cheapest)):
+                if time.perf_counter() > deadline:
+                    timed_out = True
+                    break
+                i1, i2 = cheapest[a], cheapest[b]
+                j = index.best_fit(room + weights[i1] + weights[i2])
+                if j >= 0 and values[j] > values[i1] + values[i2]:
+                    drop(i1)
+                    drop(i2)
+                    take(j)
+                    room += weights[i1] + weights[i2] - weights[j]
+                    moves['swap21'] += 1
+                    improved = True
+                    break
+            if improved or timed_out:
+                break
+
+    return sorted(chosen), {
+        'moves': moves,
+        'stopReason': 'time-budget' if timed_out else 'local-optimum',
+        'indexTime': round(index_time, 2)
+    }
+
+
+def solve_local_search(items, capacity, include_steps=True, item_indices=False,
+                       time_budget=DEFAULT_TIME_BUDGET_MS):
+    """
+    Local Search (0/1 Knapsack heuristic)
+    Seeds with the 0/1 greedy half-approximation and improves it with
+    add / swap moves until a local optimum or the time budget (ms), which
+    counts from entry so seeding and indexing are charged against it
+    Time Complexity: O(n log n) per improvement round
+    Space Complexity: O(n)
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    values = table.values
+    capacity = int(capacity)
+
+    seed = solve_greedy_01(table, capacity, include_steps=False, item_indices=True)
+    seed_profit = seed['maxProfit']
+
+    selected, stats = improve_selection(table, seed['selectedIndices'], capacity, time_budget, started=start_time)
+    max_profit = sum(values[i] for i in selected)
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'local-search',
+        'steps': steps,
+        'seed': {
+            'algorithm': 'greedy-01',
+            'maxProfit': seed_profit
+        },
+        'improvement': round(max_profit - seed_profit, 2),
+        'moves': stats['moves'],
+        'stopReason': stats['stopReason'],
+        'indexTime': stats['indexTime']
+    }
@@ -0,0 +1,189 @@
+"""
+Manifest import service - streams CSV/Parquet manifests into solver columns
+
+Rows are parsed and validated in chunks and appended straight to the
+ItemTable columns, so a large manifest never becomes a list of item dicts.
+Errors are reported with CSV line numbers (header is line 1) or 1-based
+Parquet record numbers.
+"""
+
+import csv
+import math
+import mmap
+import os
+from array import array
+from itertools import islice
+
+from algorithms.item_table import ItemTable
+
+
+REQUIRED_COLUMNS = ('item', 'weight', 'value')
+CHUNK_ROWS = 10_000
+MAX_REPORTED_ERRORS = 100
+
+
+def _parquet():
+    """pyarrow.parquet, imported on first use since it is slow to load, or None"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:  # pyarrow is optional, only needed for Parquet manifests
+        return None
+    return pq
+
+
+class _ManifestBuilder:
+    """Validates chunks of raw rows and appends them to the column arrays"""
+
+    def __init__(self):
+        self.names = []
+        self.weights = array('d')
+        self.values = array('d')
+        self.errors = []
+        self.error_count = 0
+
+    def _error(self, row_number, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row_number, 'message': message})
+
+    def add_chunk(self, rows):
+        """Validate (row_number, name, weight, value) tuples and store the good ones"""
+        names = []
+        weights = []
+        values = []
+
+        for row_number, name, weight, value in rows:
+            if name is None or str(name).strip() == '':
+                self._error(row_number, "Missing 'item' (name) field")
+                continue
+
+            try:
+                weight = float(weight)
+                value = float(value)
+            except (ValueError, TypeError):
+                self._error(row_number, f"Item '{name}' has invalid numeric values")
+                continue
+
+            # float() also accepts nan, inf and overflowing literals like 1e400
+            if not (math.isfinite(weight) and math.isfinite(value)):
+                self._error(row_number, f"Item '{name}' has non-finite numeric values")
+                continue
+
+            if weight <= 0:
+                self._error(row_number, f"Item '{name}' has invalid weight (must be > 0)")
+                continue
+
+            if value < 0:
+                self._error(row_number, f"Item '{name}' has invalid value (must be >= 0)")
+                continue
+
+            names.append(str(name))
+            weights.append(weight)
+            values.append(value)
+
+        # Once the manifest is known to be invalid there is no point keeping columns
+        if not self.error_count:
+            self.names.extend(names)
+            self.weights.extend(weights)
+            self.values.extend(values)
+
+    def add_rows(self, rows):
+        """Feed an iterator of raw rows through add_chunk, CHUNK_ROWS at a time"""
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                break
+            self.add_chunk(chunk)
+
+    def build(self):
+        """Return (table, errors) - table is None when any row was invalid"""
+        if self.error_count:
+            errors = list(self.errors)
+            hidden = self.error_count - len(errors)
+            if hidden:
+                errors.append({'row': None, 'message': f'{hidden} more invalid rows not shown'})
+            return None, errors
+
+        if not self.names:
+            return None, [{'row': None, 'message': 'Manifest contains no items'}]
+
+        return ItemTable.from_columns(self.names, self.weights, self.values), []
+
+
+def _csv_rows(reader, positions):
+    """Yield (line_number, name, weight, value) from a csv reader"""
+    width = max(positions) + 1
+    for row in reader:
+        if not row or (len(row) == 1 and not row[0].strip()):
+            continue  # Skip blank lines
+        if len(row) < width:
+            row += [''] * (width - len(row))  # Short rows fail validation below
+        yield reader.line_num, row[positions[0]], row[positions[1]], row[positions[2]]
+
+
+def _import_csv_lines(lines):
+    """Parse decoded CSV lines with a header row into an ItemTable"""
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return None, [{'row': None, 'message': 'Manifest is empty'}]
+
+    columns = [column.strip().lower() for column in header]
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        return None, [{
+            'row': 1,
+            'message': f"Header is missing column(s): {', '.join(missing)}"
+        }]
+
+    positions = [columns.index(column) for column in REQUIRED_COLUMNS]
+
+    builder = _ManifestBuilder()
+    builder.add_rows(_csv_rows(reader, positions))
+    return builder.build()
+
+
+def import_csv_manifest(stream, encoding='utf-8-sig'):
+    """Import a CSV manifest from a binary file-like object (e.g. an upload)"""
+    return _import_csv_lines(line.decode(encoding) for line in stream)
+
+
+def import_parquet_manifest(source):
+    """Import a Parquet manifest record batch by record batch (requires pyarrow)"""
+    pq = _parquet()
+    if pq is None:
+        return None, [{'row': None, 'message': 'Parquet manifests require the optional pyarrow package'}]
+
+    parquet_file = pq.ParquetFile(source)
+    missing = [column for column in REQUIRED_COLUMNS if column not in parquet_file.schema_arrow.names]
+    if missing:
+        return None, [{'row': None, 'message': f"Manifest is missing column(s): {', '.join(missing)}"}]
+
+    builder = _ManifestBuilder()
+    row_number = 1
+    for batch in parquet_file.iter_batches(batch_size=CHUNK_ROWS, columns=list(REQUIRED_COLUMNS)):
+        columns = batch.to_pydict()
+        builder.add_chunk(zip(
+            range(row_number, row_number + batch.num_rows),
+            columns['item'],
+            columns['weight'],
+            columns['value']
+        ))
+        row_number += batch.num_rows
+
+    return builder.build()
+
+
+def import_manifest_file(path, encoding='utf-8-sig'):
+    """
+    Import a manifest from a local file. CSV files are memory-mapped and
+    read line by line, so the OS pages them in instead of Python buffering.
+    """
+    if path.lower().endswith('.parquet'):
+        return import_parquet_manifest(path)
+
+    if os.path.getsize(path) == 0:
+        return None, [{'row': None, 'message': 'Manifest is empty'}]
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _import_csv_lines(line.decode(encoding) for line in iter(mm.readline, b''))
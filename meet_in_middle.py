@@ -0,0 +1,108 @@
+import time
+from heapq import merge
+
+from algorithms.item_table import ItemTable
+
+
+# Upper bound on the Pareto states kept for either half
+MAX_STATES = 1_000_000
+
+
+def _pareto_frontier(weights, values, indices, capacity):
+    """
+    Subset sums of the given items as (weight, value, mask) states sorted by
+    weight, keeping only states whose value beats every lighter state.
+    Returns (frontier, peak_states).
+    """
+    frontier = [(0, 0, 0)]
+    peak_states = 1
+
+    for bit, i in enumerate(indices):
+        weight = weights[i]
+        value = values[i]
+        flag = 1 << bit
+        shifted = [
+            (fw + weight, fv + value, fm | flag)
+            for fw, fv, fm in frontier
+            if fw + weight <= capacity
+        ]
+
+        pruned = []
+        best = -1
+        for fw, fv, fm in merge(frontier, shifted):
+            if fv > best:
+                if pruned and pruned[-1][0] == fw:
+                    pruned[-1] = (fw, fv, fm)  # Same weight, higher value
+                else:
+                    pruned.append((fw, fv, fm))
+                best = fv
+
+        frontier = pruned
+        peak_states = max(peak_states, len(frontier) + len(shifted))
+        if len(frontier) > MAX_STATES:
+            raise ValueError(
+                f'Meet-in-the-middle state limit exceeded ({MAX_STATES} states per half)'
+            )
+
+    return frontier, peak_states
+
+
+def solve_meet_in_middle(items, capacity, include_steps=True, item_indices=False):
+    """
+    Meet-in-the-Middle (0/1 Knapsack)
+    Enumerates the non-dominated subset sums of each half of the items and
+    merges them with a two-pointer sweep; independent of capacity size
+    Time Complexity: O(2^(n/2))
+    Space Complexity: O(2^(n/2)), bounded by MAX_STATES per half
+    """
+    start_time = time.perf_counter()
+
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
+    capacity = int(capacity)
+
+    mid = n // 2
+    left_indices = list(range(mid))
+    right_indices = list(range(mid, n))
+    left, left_peak = _pareto_frontier(weights, values, left_indices, capacity)
+    right, right_peak = _pareto_frontier(weights, values, right_indices, capacity)
+
+    # Lighter left states leave more room on the right, so j only moves down
+    max_profit = -1
+    best_left = best_right = 0
+    j = len(right) - 1
+    for lw, lv, lm in left:
+        while j >= 0 and lw + right[j][0] > capacity:
+            j -= 1
+        if j < 0:
+            break
+        if lv + right[j][1] > max_profit:
+            max_profit = lv + right[j][1]
+            best_left = lm
+            best_right = right[j][2]
+
+    selected = [i for bit, i in enumerate(left_indices) if best_left >> bit & 1]
+    selected += [i for bit, i in enumerate(right_indices) if best_right >> bit & 1]
+
+    steps = table.include_steps(selected) if include_steps else []
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    total_weight = table.total_weight(selected)
+
+    return {
+        'maxProfit': round(max_profit, 2),
+        'totalWeight': round(total_weight, 2),
+        **table.selection(selected),
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'meet-in-middle',
+        'steps': steps,
+        'memory': {
+            'leftStates': len(left),
+            'rightStates': len(right),
+            'peakStates': max(left_peak, right_peak),
+            'stateLimit': MAX_STATES
+        }
+    }
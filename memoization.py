@@ -1,6 +1,9 @@
 import time
 
-def solve_memoization(items, capacity):
+from algorithms.item_table import ItemTable
+
+
+def solve_memoization(items, capacity, include_steps=True, item_indices=False):
     """
     Dynamic Programming - Top-down Memoization (0/1 Knapsack)
     Recursive approach with caching
@@ -9,18 +12,13 @@ def solve_memoization(items, capacity):
     """
     start_time = time.perf_counter()  # ✅ CHANGED
 
-    n = len(items)
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
     capacity = int(capacity)
     memo = {}
 
-    # Convert weights to integers
-    int_items = []
-    for item in items:
-        int_items.append({
-            **item,
-            'weight': int(item['weight'])
-        })
-
     def knapsack(i, w):
         """Recursive function with memoization"""
         if i == 0 or w == 0:
@@ -29,9 +27,8 @@ def solve_memoization(items, capacity):
         if (i, w) in memo:
             return memo[(i, w)]
 
-        item = int_items[i-1]
-        weight = item['weight']
-        value = item['value']
+        weight = weights[i-1]
+        value = values[i-1]
 
         if weight > w:
             # Can't include item
@@ -50,30 +47,25 @@ def solve_memoization(items, capacity):
     max_profit = knapsack(n, capacity)
 
     # Backtrack to find selected items
-    selected_items = []
+    selected = []
     w = capacity
 
     for i in range(n, 0, -1):
-        if w > 0 and (i, w) in memo and (i-1, w) in memo:
-            if memo[(i, w)] != memo[(i-1, w)]:
-                item = int_items[i-1]
-                selected_items.append({
-                    **item,
-                    'selected': True,
-                    'fraction': 1.0
-                })
-                w -= item['weight']
-
-    selected_items.reverse()
+        # knapsack() fills in any (i, w) state the top-down pass never visited
+        if w > 0 and knapsack(i, w) != knapsack(i-1, w):
+            selected.append(i-1)
+            w -= weights[i-1]
+
+    selected.reverse()
 
     execution_time = (time.perf_counter() - start_time) * 1_000_000  # ✅ CHANGED to microseconds
 
-    total_weight = sum(item['weight'] for item in selected_items)
+    total_weight = table.total_weight(selected)
 
     return {
         'maxProfit': round(max_profit, 2),
         'totalWeight': round(total_weight, 2),
-        'selectedItems': selected_items,
+        **table.selection(selected),
         'executionTime': round(execution_time, 2),
         'algorithm': 'memoization',
         'steps': []
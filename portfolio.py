@@ -0,0 +1,110 @@
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+
+from algorithms.dp_tabulation import solve_dp_tabulation
+from algorithms.memoization import solve_memoization
+from algorithms.branch_bound import solve_branch_bound
+
+
+# Exact engines raced against each other by the auto solver
+RACE_ENGINES = {
+    'dp-tabulation': solve_dp_tabulation,
+    'branch-bound': solve_branch_bound,
+    'memoization': solve_memoization
+}
+
+
+def _race_worker(engine, items, capacity, options, conn):
+    """Run one exact engine in a child process and send back its result"""
+    try:
+        conn.send((RACE_ENGINES[engine](items, capacity, **options), None))
+    except Exception as e:
+        conn.send((None, str(e)))
+    finally:
+        conn.close()
+
+
+def solve_auto(items, capacity, include_steps=True, item_indices=False):
+    """
+    Portfolio Racing (0/1 Knapsack)
+    Starts every exact engine in its own process and returns the first
+    proven-optimal answer, terminating the engines that are still running
+    Time Complexity: min over the raced engines
+    Space Complexity: sum over the raced engines
+    """
+    start_time = time.perf_counter()
+
+    ctx = multiprocessing.get_context()
+    options = {'include_steps': include_steps, 'item_indices': item_indices}
+    running = {}
+    engine_started = {}
+
+    for engine in RACE_ENGINES:
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_race_worker,
+            args=(engine, items, capacity, options, child_conn),
+            daemon=True
+        )
+        engine_started[engine] = time.perf_counter()
+        process.start()
+        child_conn.close()
+        running[parent_conn] = (engine, process)
+
+    winner = None
+    winning_result = None
+    engines = []
+
+    try:
+        while running and winner is None:
+            for conn in wait(list(running)):
+                engine, process = running.pop(conn)
+                elapsed = (time.perf_counter() - engine_started[engine]) * 1_000_000
+                try:
+                    result, error = conn.recv()
+                except EOFError:
+                    result, error = None, 'Engine exited without a result'
+                conn.close()
+                process.join()
+
+                if result is not None and winner is None:
+                    winner = engine
+                    winning_result = result
+                    status = 'won'
+                else:
+                    status = 'failed' if result is None else 'finished'
+
+                engines.append({
+                    'algorithm': engine,
+                    'status': status,
+                    'elapsedTime': round(elapsed, 2),
+                    'error': error
+                })
+    finally:
+        # Kill the losers and record how long they had been running
+        for conn, (engine, process) in running.items():
+            process.terminate()
+            process.join()
+            conn.close()
+            elapsed = (time.perf_counter() - engine_started[engine]) * 1_000_000
+            engines.append({
+                'algorithm': engine,
+                'status': 'terminated',
+                'elapsedTime': round(elapsed, 2),
+                'error': None
+            })
+
+    if winner is None:
+        errors = '; '.join(f"{e['algorithm']}: {e['error']}" for e in engines)
+        raise RuntimeError(f'All raced engines failed ({errors})')
+
+    execution_time = (time.perf_counter() - start_time) * 1_000_000  # microseconds
+
+    return {
+        **winning_result,
+        'executionTime': round(execution_time, 2),
+        'algorithm': 'auto',
+        'winner': winner,
+        'engines': engines
+    }
@@ -0,0 +1,95 @@
+"""
+Preset result cache - precomputed solver results for the static DATA_PRESETS
+
+Requests are matched to a preset by fingerprint (capacity plus every item's
+name, weight and value), so a preset edited client-side simply misses the
+cache. Entries are filled eagerly by warm() or lazily on first request, with
+one lock per entry so concurrent first requests solve it only once.
+"""
+
+import threading
+import time
+
+
+def fingerprint(items, capacity):
+    """Exact, hashable identity of an instance"""
+    try:
+        return (
+            float(capacity),
+            tuple((str(item['item']), float(item['weight']), float(item['value'])) for item in items)
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class PresetCache:
+    """Per-(preset, algorithm) results for the default response shape"""
+
+    def __init__(self, presets, algorithms):
+        self._algorithms = algorithms
+        self._presets = {
+            fingerprint(preset['items'], preset['capacity']): preset for preset in presets
+        }
+        self._sizes = {len(preset['items']) for preset in presets}
+        self._results = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'warmupTime': 0,
+            'warmupErrors': [],
+            'entries': 0
+        }
+
+    def _solve(self, key, algorithm, items, capacity):
+        """Compute an entry once, even under concurrent first requests"""
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            result = self._results.get(key)
+            if result is None:
+                result = self._algorithms[algorithm](items, capacity)
+                self._results[key] = result
+                self.stats['misses'] += 1
+                self.stats['entries'] = len(self._results)
+            else:
+                self.stats['hits'] += 1
+        return result
+
+    def get(self, algorithm, items, capacity):
+        """Cached result if items/capacity match a preset exactly, else None"""
+        if len(items) not in self._sizes:
+            return None
+
+        instance = fingerprint(items, capacity)
+        if instance not in self._presets:
+            return None
+
+        key = (instance, algorithm)
+        result = self._results.get(key)
+        if result is None:
+            result = self._solve(key, algorithm, items, capacity)
+        else:
+            self.stats['hits'] += 1
+
+        return {**result, 'cached': True}
+
+    def warm(self):
+        """Precompute every preset x algorithm and record the startup cost"""
+        start_time = time.perf_counter()
+
+        for instance, preset in self._presets.items():
+            for algorithm in self._algorithms:
+                try:
+                    self._solve((instance, algorithm), algorithm, preset['items'], preset['capacity'])
+                except Exception as e:
+                    self.stats['warmupErrors'].append({
+                        'preset': preset['name'],
+                        'algorithm': algorithm,
+                        'error': str(e)
+                    })
+
+        self.stats['warmupTime'] = round((time.perf_counter() - start_time) * 1_000_000, 2)  # microseconds
+        return self.stats
@@ -1,7 +1,9 @@
 import time
 
+from algorithms.item_table import ItemTable
 
-def solve_recursion(items, capacity):
+
+def solve_recursion(items, capacity, include_steps=True, item_indices=False):
     """
     Pure Recursive Solution (0/1 Knapsack)
     Direct recursive approach without memoization
@@ -10,25 +12,19 @@ def solve_recursion(items, capacity):
     """
     start_time = time.perf_counter()  # ✅ CHANGED
     
-    n = len(items)
+    table = ItemTable(items, item_indices=item_indices)
+    weights = table.weights
+    values = table.values
+    n = len(table)
     capacity = int(capacity)
     
-    # Convert weights to integers
-    int_items = []
-    for item in items:
-        int_items.append({
-            **item,
-            'weight': int(item['weight'])
-        })
-    
     def knapsack(i, w):
         """Recursive function without memoization"""
         if i == 0 or w == 0:
             return 0
         
-        item = int_items[i-1]
-        weight = item['weight']
-        value = item['value']
+        weight = weights[i-1]
+        value = values[i-1]
         
         if weight > w:
             # Can't include item
@@ -44,33 +40,29 @@ def solve_recursion(items, capacity):
     max_profit = knapsack(n, capacity)
     
     # Backtrack to find selected items (we need to recalculate)
-    selected_items = []
+    selected = []
     w = capacity
     
     for i in range(n, 0, -1):
         if w > 0:
-            item = int_items[i-1]
+            weight = weights[i-1]
             without_item = knapsack(i-1, w)
-            with_item = item['value'] + knapsack(i-1, w-item['weight']) if item['weight'] <= w else 0
+            with_item = values[i-1] + knapsack(i-1, w-weight) if weight <= w else 0
             
             if with_item > without_item:
-                selected_items.append({
-                    **item,
-                    'selected': True,
-                    'fraction': 1.0
-                })
-                w -= item['weight']
+                selected.append(i-1)
+                w -= weight
     
-    selected_items.reverse()
+    selected.reverse()
     
     execution_time = (time.perf_counter() - start_time) * 1_000_000  # ✅ CHANGED to microseconds
     
-    total_weight = sum(item['weight'] for item in selected_items)
+    total_weight = table.total_weight(selected)
     
     return {
         'maxProfit': round(max_profit, 2),
         'totalWeight': round(total_weight, 2),
-        'selectedItems': selected_items,
+        **table.selection(selected),
         'executionTime': round(execution_time, 2),
         'algorithm': 'recursion',
         'steps': []
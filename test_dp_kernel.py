@@ -0,0 +1,52 @@
+"""
+DP kernel backend tests - the numba and Python kernels must agree
+
+    python -m pytest test_dp_kernel.py
+"""
+
+import random
+from array import array
+
+import pytest
+
+from algorithms.dp_kernel import dp_solve, select_backend, NUMBA_MIN_CELLS
+
+pytest.importorskip('numpy')
+pytest.importorskip('numba')
+
+
+def _instance(seed, float_values=False):
+    """Seeded random (weights, values, capacity) as solver columns"""
+    rng = random.Random(seed)
+    n = rng.randint(1, 40)
+    weights = array('q', (rng.randint(1, 60) for _ in range(n)))
+    if float_values:
+        values = array('d', (round(rng.uniform(0, 500), 2) for _ in range(n)))
+    else:
+        values = array('q', (rng.randint(0, 500) for _ in range(n)))
+    capacity = rng.randint(0, sum(weights))
+    return weights, values, capacity
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_backends_agree_on_integer_values(seed):
+    weights, values, capacity = _instance(seed)
+    assert dp_solve(weights, values, capacity, backend='numba') == dp_solve(weights, values, capacity, backend='python')
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_backends_agree_on_float_values(seed):
+    weights, values, capacity = _instance(seed, float_values=True)
+    assert dp_solve(weights, values, capacity, backend='numba') == dp_solve(weights, values, capacity, backend='python')
+
+
+def test_small_tables_use_the_python_kernel():
+    weights, values, capacity = _instance(0)
+    assert len(weights) * (capacity + 1) < NUMBA_MIN_CELLS
+    assert select_backend(weights, values, capacity) == 'python'
+
+
+def test_large_tables_use_the_numba_kernel():
+    weights = array('q', [1] * 100)
+    values = array('q', [1] * 100)
+    assert select_backend(weights, values, NUMBA_MIN_CELLS) == 'numba'
@@ -49,9 +49,57 @@ def validate_capacity(capacity):
 
 def validate_algorithm(algorithm):
     """Validate algorithm selection"""
-    valid_algorithms = ['greedy', 'dp-tabulation', 'memoization', 'recursion', 'branch-bound']
+    valid_algorithms = ['greedy', 'greedy-01', 'dp-tabulation', 'dp-hirschberg', 'dp-parallel', 'dp-out-of-core', 'memoization', 'recursion', 'branch-bound', 'meet-in-middle', 'fptas', 'local-search', 'auto']
     
     if algorithm not in valid_algorithms:
         return False, f"Invalid algorithm. Must be one of: {', '.join(valid_algorithms)}"
     
     return True, "Valid"
+
+
+def validate_selected_format(selected_format):
+    """Validate how selected items are returned"""
+    valid_formats = ['items', 'indices']
+    
+    if selected_format not in valid_formats:
+        return False, f"Invalid selectedFormat. Must be one of: {', '.join(valid_formats)}"
+    
+    return True, "Valid"
+
+
+def validate_include_steps(include_steps):
+    """Validate the includeSteps flag (a real boolean, not a truthy value)"""
+    if not isinstance(include_steps, bool):
+        return False, "includeSteps must be true or false"
+    
+    return True, "Valid"
+
+
+def validate_gzip(gzip):
+    """Validate the export gzip flag (a real boolean, not a truthy value)"""
+    if not isinstance(gzip, bool):
+        return False, "gzip must be true or false"
+    
+    return True, "Valid"
+
+
+def validate_epsilon(epsilon):
+    """Validate FPTAS approximation parameter"""
+    try:
+        eps = float(epsilon)
+        if not 0 < eps < 1:
+            return False, "Epsilon must be between 0 and 1 (exclusive)"
+        return True, "Valid"
+    except (ValueError, TypeError):
+        return False, "Epsilon must be a valid number"
+
+
+def validate_time_budget(time_budget):
+    """Validate local search time budget (milliseconds)"""
+    try:
+        budget = float(time_budget)
+        if budget <= 0:
+            return False, "Time budget must be greater than 0"
+        return True, "Valid"
+    except (ValueError, TypeError):
+        return False, "Time budget must be a valid number"